@@ -2,19 +2,40 @@
 Sequence pattern parsing and frame discovery.
 
 Implements parallel batch processing for large directories using ThreadPoolExecutor
-while maintaining API compatibility with the sequential version.
+on free-threaded Python builds, while maintaining API compatibility with the
+sequential version. Under the GIL the batches are pure-Python CPU work that
+threads cannot overlap, so discovery runs sequentially there.
 """
 
 import re
 import os
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
-from functools import partial
+from functools import lru_cache, partial
 
 from .types import SequencePathPattern, SequenceSpec, FileProbe
 
 
+# Image extensions recognised by sequence discovery (lowercase)
+_IMAGE_EXT_SET = frozenset(('.exr', '.jpg', '.jpeg', '.png', '.tiff', '.tif'))
+
+# ASCII digits, for scanning frame numbers without str.isdigit()'s Unicode rules
+_DIGITS = frozenset('0123456789')
+
+# Batch parsing only benefits from threads when the GIL is disabled (3.13t+)
+_GIL_ENABLED = getattr(sys, '_is_gil_enabled', lambda: True)()
+
+# Precompiled patterns used to build frame-matching regexes
+_PRINTF_RE = re.compile(r'%0\d+d')
+# Matches a run of hashes in a re.escape()d pattern ('#' escapes to '\#')
+_HASH_RE = re.compile(r'(?:\\#)+')
+# Frame tokens in an unescaped pattern string
+_FRAME_TOKEN_RE = re.compile(r'%0\d+d|#+')
+
+
 class SequenceDiscovery:
     """Discovers image frames matching a pattern."""
 
@@ -24,6 +45,8 @@ class SequenceDiscovery:
         Calculate optimal number of worker threads based on file count.
         
         Strategy:
+        - GIL-enabled interpreter: 1 worker (threads cannot run the
+          pure-Python batches concurrently, they only add overhead)
         - Small directories (<100 files): 1 worker (sequential, overhead not worth it)
         - Medium directories (100-1000 files): min(4, cpu_count)
         - Large directories (>1000 files): min(8, cpu_count)
@@ -34,8 +57,8 @@ class SequenceDiscovery:
         Returns:
             Optimal number of workers (1 = sequential fallback)
         """
-        if file_count < 100:
-            return 1  # Sequential fallback for small directories
+        if _GIL_ENABLED or file_count < 100:
+            return 1  # Sequential fallback (GIL build or small directory)
         
         available_cores = os.cpu_count() or 4
         
@@ -45,10 +68,22 @@ class SequenceDiscovery:
             return min(8, available_cores)
 
     @staticmethod
-    def _process_sequences_batch(
-        filenames: List[str],
-        image_exts: set = None
-    ) -> dict:
+    def _chunk(items: List[str], workers: int) -> List[List[str]]:
+        """
+        Split items into chunks for the worker pool.
+        
+        Aims for ~2 chunks per worker (some load balancing) while keeping
+        chunks large (>= 500 items) so per-future overhead and the merge
+        step stay small next to the actual parsing.
+        """
+        chunk_size = max(500, len(items) // (workers * 2))
+        return [
+            items[i:i+chunk_size]
+            for i in range(0, len(items), chunk_size)
+        ]
+
+    @staticmethod
+    def _process_sequences_batch(filenames: List[str]) -> dict:
         """
         Process a batch of filenames to extract sequence patterns.
         
@@ -56,22 +91,15 @@ class SequenceDiscovery:
         Each thread processes a chunk of filenames independently.
         
         Args:
-            filenames: List of filenames to process
-            image_exts: Set of valid image extensions
+            filenames: List of image filenames to process (already filtered
+                by extension during enumeration)
         
         Returns:
             Dictionary mapping pattern_str -> set of frame numbers
         """
-        if image_exts is None:
-            image_exts = {'.exr', '.jpg', '.jpeg', '.png', '.tiff', '.tif'}
-        
-        sequences = {}
+        sequences = defaultdict(set)
         
         for filename in filenames:
-            # Filter by extension
-            if Path(filename).suffix.lower() not in image_exts:
-                continue
-            
             # Extract frame number: search from right to find digits immediately before extension
             # This handles cases like seq_1.0000.exr where 0000 (not 1) is the frame number
             last_dot_idx = filename.rfind('.')
@@ -82,31 +110,33 @@ class SequenceDiscovery:
             name_before_ext = filename[:last_dot_idx]
             ext = filename[last_dot_idx:]
             
-            # Find the rightmost sequence of digits before the extension
-            match_digits = re.search(r'(\d+)$', name_before_ext)
+            # Find the rightmost run of digits before the extension
+            # (plain string scan; cheaper than a regex search per file)
+            end = len(name_before_ext)
+            i = end
+            while i > 0 and name_before_ext[i - 1] in _DIGITS:
+                i -= 1
+            if i == end:
+                continue
+            
+            num_str = name_before_ext[i:]
+            num_len = end - i
+            
+            # Get the base (everything before the frame number)
+            base = name_before_ext[:i]
             
-            if match_digits:
-                num_str = match_digits.group(1)
-                num_len = len(num_str)
-                
-                # Get the base (everything before the frame number)
-                base = name_before_ext[:match_digits.start()]
-                
-                # Generate pattern: %0Nd format (e.g., %05d for 5 digits)
-                pattern = f"{base}%0{num_len}d{ext}"
-                if pattern not in sequences:
-                    sequences[pattern] = set()
-                try:
-                    sequences[pattern].add(int(num_str))
-                except ValueError:
-                    pass
+            # Generate pattern: %0Nd format (e.g., %05d for 5 digits)
+            pattern = f"{base}%0{num_len}d{ext}"
+            sequences[pattern].add(int(num_str))
         
         return sequences
 
     @staticmethod
     def _process_frames_batch(
         filenames: List[str],
-        regex: 're.Pattern'
+        regex: 're.Pattern',
+        prefix: str = "",
+        suffix: str = ""
     ) -> set:
         """
         Process a batch of filenames to extract frame numbers.
@@ -117,6 +147,8 @@ class SequenceDiscovery:
         Args:
             filenames: List of filenames to process
             regex: Compiled regex pattern for matching
+            prefix: Literal text before the first frame token
+            suffix: Literal text after the last frame token
         
         Returns:
             Set of frame numbers found
@@ -124,13 +156,48 @@ class SequenceDiscovery:
         frames = set()
         
         for filename in filenames:
+            # Cheap literal check rejects most non-matching files before the regex
+            if not (filename.startswith(prefix) and filename.endswith(suffix)):
+                continue
             match = regex.match(filename)
             if match:
-                try:
-                    frame_num = int(match.group(1))
-                    frames.add(frame_num)
-                except (IndexError, ValueError):
-                    continue
+                # (\d+) guarantees int() succeeds
+                frames.add(int(match.group(1)))
+        
+        return frames
+
+    @staticmethod
+    def _process_frames_batch_fast(
+        filenames: List[str],
+        prefix: str,
+        suffix: str
+    ) -> set:
+        """
+        Extract frame numbers for a pattern with exactly one frame token.
+        
+        Equivalent to _process_frames_batch for single-token patterns, but
+        slices the digits out between prefix and suffix instead of matching
+        a regex.
+        
+        Args:
+            filenames: List of filenames to process
+            prefix: Literal text before the frame token
+            suffix: Literal text after the frame token
+        
+        Returns:
+            Set of frame numbers found
+        """
+        frames = set()
+        plen = len(prefix)
+        slen = len(suffix)
+        
+        for filename in filenames:
+            if not (filename.startswith(prefix) and filename.endswith(suffix)):
+                continue
+            mid = filename[plen:len(filename) - slen]
+            # isdecimal() accepts exactly what the regex's (\d+) would
+            if mid.isdecimal():
+                frames.add(int(mid))
         
         return frames
 
@@ -139,8 +206,8 @@ class SequenceDiscovery:
         """
         Auto-discover all image sequences in directory.
         
-        Parallelized for directories with 100+ files using ThreadPoolExecutor.
-        For small directories, falls back to sequential processing.
+        Parallelized for directories with 100+ files using ThreadPoolExecutor
+        on free-threaded builds; otherwise processed sequentially.
         
         Returns list of (pattern_str, frame_list) tuples.
         """
@@ -148,50 +215,46 @@ class SequenceDiscovery:
         if not dir_path.is_dir():
             return []
         
-        # Phase 1: Collect all files (sequential, single I/O operation)
-        files = sorted([f.name for f in dir_path.iterdir() if f.is_file()])
-        if not files:
-            return []
-        
-        # Phase 2: Filter by image extensions (sequential, fast)
-        image_exts = {'.exr', '.jpg', '.jpeg', '.png', '.tiff', '.tif'}
-        image_files = [f for f in files if Path(f).suffix.lower() in image_exts]
+        # Phase 1: Collect image files in a single pass over the directory.
+        # scandir reuses the dirent type info (no stat() per entry) and the
+        # extension filter is applied while walking, so no second pass.
+        with os.scandir(directory) as it:
+            image_files = [
+                e.name for e in it
+                if e.is_file(follow_symlinks=False) and _has_image_ext(e.name)
+            ]
         if not image_files:
             return []
         
-        # Phase 3: Determine parallelization strategy
+        # Phase 2: Determine parallelization strategy
         optimal_workers = SequenceDiscovery._calculate_optimal_workers(len(image_files))
         
-        # Phase 4: Process patterns (parallel or sequential)
+        # Phase 3: Process patterns (parallel or sequential)
         if optimal_workers == 1:
             # Sequential fallback for small directories
-            all_sequences = SequenceDiscovery._process_sequences_batch(image_files, image_exts)
+            all_sequences = SequenceDiscovery._process_sequences_batch(image_files)
         else:
             # Parallel processing with chunking
-            chunk_size = max(50, len(image_files) // optimal_workers)
-            chunks = [
-                image_files[i:i+chunk_size]
-                for i in range(0, len(image_files), chunk_size)
-            ]
+            chunks = SequenceDiscovery._chunk(image_files, optimal_workers)
             
             all_sequences = {}
             
             # Process chunks in parallel using ThreadPoolExecutor
             with ThreadPoolExecutor(max_workers=optimal_workers) as executor:
-                batch_processor = partial(
-                    SequenceDiscovery._process_sequences_batch,
-                    image_exts=image_exts
-                )
-                
                 # Map function over chunks and collect results
-                for batch_result in executor.map(batch_processor, chunks):
+                for batch_result in executor.map(
+                    SequenceDiscovery._process_sequences_batch, chunks
+                ):
                     # Merge batch results into all_sequences
                     for pattern, frames in batch_result.items():
-                        if pattern not in all_sequences:
-                            all_sequences[pattern] = set()
-                        all_sequences[pattern].update(frames)
+                        existing = all_sequences.get(pattern)
+                        if existing is None:
+                            # Take ownership of the batch's set; no copy
+                            all_sequences[pattern] = frames
+                        else:
+                            existing |= frames
         
-        # Phase 5: Convert to return format and sort
+        # Phase 4: Convert to return format and sort
         result = []
         for pattern in sorted(all_sequences.keys()):
             frames = sorted(all_sequences[pattern])
@@ -205,8 +268,8 @@ class SequenceDiscovery:
         """
         Scan directory for files matching pattern; return sorted frame numbers.
         
-        Parallelized for directories with 100+ files using ThreadPoolExecutor.
-        For small directories, falls back to sequential processing.
+        Parallelized for directories with 100+ files using ThreadPoolExecutor
+        on free-threaded builds; otherwise processed sequentially.
 
         Pattern format:
         - %04d (printf-style)
@@ -217,43 +280,107 @@ class SequenceDiscovery:
             return []
 
         # Phase 1: Collect all files (sequential, single I/O operation)
-        files = sorted([f.name for f in dir_path.iterdir() if f.is_file()])
+        with os.scandir(directory) as it:
+            files = [e.name for e in it if e.is_file(follow_symlinks=False)]
         if not files:
             return []
         
-        # Phase 2: Build regex pattern
-        regex_str = _pattern_to_regex(pattern_str)
-        regex = re.compile(regex_str)
+        # Phase 2: Pick the matcher for this pattern
+        batch_processor = SequenceDiscovery._frames_batch_processor(pattern_str)
+        if batch_processor is None:
+            return []
+        
+        # Phase 3-4: Match frames (parallel or sequential)
+        return sorted(SequenceDiscovery._match_frames(files, batch_processor))
+
+    @staticmethod
+    def discover_frames_bulk(
+        pattern_strs: List[str], directory: str
+    ) -> dict[str, List[int]]:
+        """
+        Discover frames for several patterns in the same directory.
+        
+        Equivalent to calling discover_frames() once per pattern, but the
+        directory is enumerated only once.
+        
+        Returns dict mapping pattern_str -> sorted frame numbers.
+        """
+        result = {pattern_str: [] for pattern_str in pattern_strs}
+        if not Path(directory).is_dir():
+            return result
+
+        with os.scandir(directory) as it:
+            files = [e.name for e in it if e.is_file(follow_symlinks=False)]
+        if not files:
+            return result
+
+        for pattern_str in result:
+            batch_processor = SequenceDiscovery._frames_batch_processor(pattern_str)
+            if batch_processor is not None:
+                result[pattern_str] = sorted(
+                    SequenceDiscovery._match_frames(files, batch_processor)
+                )
+        return result
+
+    @staticmethod
+    def _frames_batch_processor(pattern_str: str) -> Optional[Callable[[List[str]], set]]:
+        """
+        Build the batch function extracting frame numbers for a pattern.
+        
+        Returns None if the pattern has no frame token.
+        """
+        # Regex is cached per pattern string
+        regex = _compile_pattern(pattern_str)
+        if not regex.groups:
+            # No frame token in pattern, so there is no frame number to extract
+            return None
+        prefix, suffix = _pattern_affixes(pattern_str)
         
-        # Phase 3: Determine parallelization strategy
+        # Single-token patterns (the common case) need no regex at all:
+        # the frame number is whatever lies between prefix and suffix.
+        if regex.groups == 1:
+            return partial(
+                SequenceDiscovery._process_frames_batch_fast,
+                prefix=prefix,
+                suffix=suffix
+            )
+        return partial(
+            SequenceDiscovery._process_frames_batch,
+            regex=regex,
+            prefix=prefix,
+            suffix=suffix
+        )
+
+    @staticmethod
+    def _match_frames(
+        files: List[str], batch_processor: Callable[[List[str]], set]
+    ) -> set:
+        """Run a frame batch function over files, in parallel when worthwhile."""
+        # Determine parallelization strategy
         optimal_workers = SequenceDiscovery._calculate_optimal_workers(len(files))
         
-        # Phase 4: Process frames (parallel or sequential)
         if optimal_workers == 1:
             # Sequential fallback for small directories
-            all_frames = SequenceDiscovery._process_frames_batch(files, regex)
-        else:
-            # Parallel processing with chunking
-            chunk_size = max(50, len(files) // optimal_workers)
-            chunks = [
-                files[i:i+chunk_size]
-                for i in range(0, len(files), chunk_size)
-            ]
-            
-            all_frames = set()
-            
-            # Process chunks in parallel using ThreadPoolExecutor
-            with ThreadPoolExecutor(max_workers=optimal_workers) as executor:
-                batch_processor = partial(
-                    SequenceDiscovery._process_frames_batch,
-                    regex=regex
-                )
-                
-                # Map function over chunks and collect results
-                for batch_frames in executor.map(batch_processor, chunks):
-                    all_frames.update(batch_frames)
+            return batch_processor(files)
+        
+        # Parallel processing with chunking
+        chunks = SequenceDiscovery._chunk(files, optimal_workers)
+        
+        all_frames = set()
         
-        return sorted(all_frames)
+        # Process chunks in parallel using ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=optimal_workers) as executor:
+            # Map function over chunks and collect results
+            for batch_frames in executor.map(batch_processor, chunks):
+                all_frames.update(batch_frames)
+        
+        return all_frames
+
+
+def _has_image_ext(name: str) -> bool:
+    """Check for an image extension, lowercasing only the suffix."""
+    dot = name.rfind('.')
+    return dot >= 0 and name[dot:].lower() in _IMAGE_EXT_SET
 
 
 def _pattern_to_regex(pattern: str) -> str:
@@ -262,10 +389,23 @@ def _pattern_to_regex(pattern: str) -> str:
     escaped = re.escape(pattern)
     
     # Replace printf-style %0Nd with capture group (\d+)
-    # Use lambda to properly handle backslashes in the replacement
-    escaped = re.sub(r"%0\d+d", lambda m: r"(\d+)", escaped)
+    escaped = _PRINTF_RE.sub(r"(\\d+)", escaped)
     
     # Replace hash-style #### with capture group (\d+)
-    escaped = re.sub(r"#+", lambda m: r"(\d+)", escaped)
+    escaped = _HASH_RE.sub(r"(\\d+)", escaped)
     
     return f"^{escaped}$"
+
+
+def _pattern_affixes(pattern: str) -> tuple[str, str]:
+    """Return the literal text before the first and after the last frame token."""
+    tokens = list(_FRAME_TOKEN_RE.finditer(pattern))
+    if not tokens:
+        return pattern, ""
+    return pattern[:tokens[0].start()], pattern[tokens[-1].end():]
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern_str: str) -> 're.Pattern':
+    """Compile a sequence pattern's regex, cached across discovery calls."""
+    return re.compile(_pattern_to_regex(pattern_str))
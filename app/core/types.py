@@ -2,9 +2,11 @@
 Core data types for EXR Toolkit.
 
 All types use @dataclass and Enum for structured, immutable representations.
-No loose dicts at the internal API boundary.
+No loose dicts at the internal API boundary. Dataclasses use __slots__;
+value types are also frozen (use dataclasses.replace to derive changes).
 """
 
+import re
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Optional, TYPE_CHECKING
@@ -14,6 +16,9 @@ from pathlib import Path
 if TYPE_CHECKING:
     from ..processing import ProcessingPipeline
 
+# Frame token in a sequence pattern: printf-style %0Nd or a run of hashes
+_FRAME_TOKEN_RE = re.compile(r"%0(\d+)d|#+")
+
 
 class AttributeSource(Enum):
     """Where an attribute originates."""
@@ -53,14 +58,14 @@ class ResizeAlgorithm(Enum):
     NEAREST = auto()        # Nearest neighbor (fastest)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChannelFormat:
     """Wraps OIIO channel type information."""
     oiio_type: str  # e.g., "float", "half", "uint32", etc.
     description: str = ""  # human-readable description
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChannelSourceRef:
     """Reference to a channel in a source sequence."""
     sequence_id: str
@@ -68,7 +73,7 @@ class ChannelSourceRef:
     subimage_index: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChannelSpec:
     """Immutable channel specification."""
     name: str
@@ -77,7 +82,7 @@ class ChannelSpec:
     subimage_index: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AttributeSpec:
     """Immutable attribute specification."""
     name: str
@@ -88,25 +93,50 @@ class AttributeSpec:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeSet:
     """Collection of attributes with lookup helpers."""
     attributes: list[AttributeSpec] = field(default_factory=list)
+    # name -> position in `attributes` (first occurrence), for O(1) lookups
+    _index: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Rebuild the name index from the attribute list."""
+        index: dict[str, int] = {}
+        for i, attr in enumerate(self.attributes):
+            index.setdefault(attr.name, i)
+        self._index = index
+
+    def _position(self, name: str) -> Optional[int]:
+        """Index of the named attribute, or None.
+
+        The attribute list may be shared with (and mutated by) UI models, so
+        a stale entry or a size mismatch triggers a rebuild of the index.
+        """
+        idx = self._index.get(name)
+        attrs = self.attributes
+        if idx is not None and idx < len(attrs) and attrs[idx].name == name:
+            return idx
+        if idx is not None or len(self._index) != len(attrs):
+            self._reindex()
+            return self._index.get(name)
+        return None
 
     def get_by_name(self, name: str) -> Optional[AttributeSpec]:
         """Find attribute by name."""
-        for attr in self.attributes:
-            if attr.name == name:
-                return attr
-        return None
+        idx = self._position(name)
+        return self.attributes[idx] if idx is not None else None
 
     def add_or_update(self, attr: AttributeSpec) -> None:
         """Add new attribute or update existing one by name."""
-        existing = self.get_by_name(attr.name)
-        if existing:
-            idx = self.attributes.index(existing)
+        idx = self._position(attr.name)
+        if idx is not None:
             self.attributes[idx] = attr
         else:
+            self._index[attr.name] = len(self.attributes)
             self.attributes.append(attr)
 
     def names(self) -> list[str]:
@@ -117,7 +147,7 @@ class AttributeSet:
         return len(self.attributes)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageSpecSnapshot:
     """Immutable snapshot of OIIO ImageSpec fields we care about."""
     width: int
@@ -130,7 +160,7 @@ class ImageSpecSnapshot:
     format: str = "unknown"  # pixel format
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubImageProbe:
     """Probed data from one subimage/part of a file."""
     spec: ImageSpecSnapshot
@@ -138,7 +168,7 @@ class SubImageProbe:
     attributes: AttributeSet
 
 
-@dataclass
+@dataclass(slots=True)
 class FileProbe:
     """Probed data from a single file."""
     path: str
@@ -154,10 +184,21 @@ class FileProbe:
 class SequencePathPattern:
     """Parses and formats sequence path patterns."""
     pattern: str
+    # Pre-split form of a single-token pattern (width 0 = not pre-split)
+    _prefix: str = field(default="", init=False, repr=False, compare=False)
+    _suffix: str = field(default="", init=False, repr=False, compare=False)
+    _width: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        tokens = list(_FRAME_TOKEN_RE.finditer(self.pattern))
+        if len(tokens) == 1:
+            token = tokens[0]
+            self._prefix = self.pattern[:token.start()]
+            self._suffix = self.pattern[token.end():]
+            self._width = int(token.group(1)) if token.group(1) else len(token.group(0))
 
     def to_regex(self) -> str:
         """Convert pattern to regex for frame discovery."""
-        import re
         # Support %04d (printf) and #### (hash) styles
         regex = re.escape(self.pattern)
         regex = regex.replace(r"\%0\d+d", r"(\d+)")
@@ -166,7 +207,9 @@ class SequencePathPattern:
 
     def format(self, frame: int) -> str:
         """Format a frame number into the pattern."""
-        import re
+        if self._width:
+            return f"{self._prefix}{frame:0{self._width}d}{self._suffix}"
+        # Zero or several tokens: substitute every token
         result = self.pattern
         # %04d style
         result = re.sub(r"%0(\d+)d", lambda m: str(frame).zfill(int(m.group(1))), result)
@@ -178,7 +221,7 @@ class SequencePathPattern:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SequenceSpec:
     """Specification for a single image sequence."""
     id: str
@@ -195,8 +238,22 @@ class SequenceSpec:
             return self.static_probe
         return self.per_frame_probes.get(frame)
 
-
-@dataclass
+    @property
+    def validation_key(self) -> tuple:
+        """
+        Fingerprint of the fields export validation reads.
+        Compared by value (not hashed), so equal keys mean equal inputs.
+        """
+        probe_key = None
+        if self.static_probe:
+            probe_key = tuple(
+                (sub.spec.width, sub.spec.height, tuple(ch.name for ch in sub.channels))
+                for sub in self.static_probe.subimages
+            )
+        return (self.id, len(self.frames), probe_key)
+
+
+@dataclass(slots=True, frozen=True)
 class OutputChannel:
     """Definition of a channel in the output."""
     output_name: str
@@ -232,7 +289,7 @@ class ResizeSpec:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportSpec:
     """Complete export specification."""
     output_dir: str
@@ -245,8 +302,27 @@ class ExportSpec:
     resize_spec: ResizeSpec = field(default_factory=ResizeSpec)
     frame_range: Optional[tuple[int, int]] = None  # (start, end) inclusive
 
+    @property
+    def validation_key(self) -> tuple:
+        """
+        Fingerprint of the fields export validation reads.
+        Compared by value (not hashed), so equal keys mean equal inputs.
+        """
+        attrs = tuple(
+            (a.name, a.oiio_type, repr(a.value), a.editable)
+            for a in self.output_attributes.attributes
+        )
+        return (
+            self.output_dir,
+            self.filename_pattern,
+            tuple(self.output_channels),
+            attrs,
+            self.frame_policy,
+            self.resize_spec.policy,
+        )
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ValidationIssue:
     """A validation problem."""
     severity: ValidationSeverity
@@ -257,7 +333,7 @@ class ValidationIssue:
     def __str__(self) -> str:
         return f"[{self.severity.name}] {self.code}: {self.message}"
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingConfig:
     """Configuration for image processing pipeline."""
     enabled: bool = False
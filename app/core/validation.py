@@ -5,17 +5,34 @@ Structured validation rules that must pass before export.
 Returns ValidationIssue list; ERROR severity blocks export.
 """
 
-from typing import List
-from pathlib import Path
+import os
+import re
+from collections import Counter, OrderedDict
+from typing import Iterator, List, Optional
 
 from ..core import (
+    ChannelSpec,
     ExportSpec,
+    ResizePolicy,
     ValidationIssue,
     ValidationSeverity,
     SequenceSpec,
 )
 
 
+# Frame tokens the export filename formatter substitutes (%0Nd, #...)
+_FRAME_TOKEN_RE = re.compile(r"%0\d+d|#+")
+
+# Stage results keyed by (stage name, export validation_key, sequence
+# validation_keys). The keys are value tuples, so a hit requires equal inputs.
+# LRU-ordered; the oldest entry is evicted past _STAGE_CACHE_SIZE.
+_STAGE_CACHE: OrderedDict[tuple, tuple[ValidationIssue, ...]] = OrderedDict()
+_STAGE_CACHE_SIZE = 64
+
+# Output directories already confirmed to exist (failures are not cached)
+_PATH_CHECK_CACHE: set[str] = set()
+
+
 class ValidationEngine:
     """Validates export configurations."""
 
@@ -23,269 +40,281 @@ class ValidationEngine:
     def validate_export(
         export_spec: ExportSpec,
         sequences: dict[str, SequenceSpec],
+        fail_fast: bool = True,
+        max_errors: int = 1,
     ) -> List[ValidationIssue]:
         """
         Validate export spec and sequences.
 
         Returns list of ValidationIssue; export is blocked if any ERROR present.
+        With fail_fast, validation stops once max_errors ERROR issues have
+        been collected; pass fail_fast=False to gather every issue (UI report).
         """
-        issues = []
-
-        # 1. Output channels validation
-        issues.extend(ValidationEngine._validate_output_channels(export_spec))
-
-        # 2. Channel format compatibility
-        issues.extend(
-            ValidationEngine._validate_channel_formats(export_spec, sequences)
+        # Stages ordered cheapest-first; the per-channel/per-sequence
+        # checks run last so a fail-fast export can skip them.
+        # The export path stage touches the filesystem and is never cached.
+        stages = (
+            (ValidationEngine._validate_output_channels, (export_spec,), True),
+            (ValidationEngine._validate_attributes, (export_spec,), True),
+            (ValidationEngine._validate_export_path, (export_spec,), False),
+            (ValidationEngine._validate_channel_formats, (export_spec, sequences), True),
+            (ValidationEngine._validate_sequence_policy, (export_spec, sequences), True),
         )
-
-        # 3. Export path validation
-        issues.extend(ValidationEngine._validate_export_path(export_spec))
-
-        # 4. Sequence policy validation
-        issues.extend(
-            ValidationEngine._validate_sequence_policy(export_spec, sequences)
+        fingerprint = (
+            export_spec.validation_key,
+            tuple((seq_id, seq.validation_key) for seq_id, seq in sequences.items()),
         )
 
-        # 5. Attributes validation
-        issues.extend(ValidationEngine._validate_attributes(export_spec))
+        issues = []
+        error_count = 0
+        for stage, args, cacheable in stages:
+            if cacheable:
+                stage_issues = _cached_stage(stage, args, fingerprint)
+            else:
+                stage_issues = stage(*args)
+
+            for issue in stage_issues:
+                issues.append(issue)
+                if issue.severity == ValidationSeverity.ERROR:
+                    error_count += 1
+                    if fail_fast and error_count >= max_errors:
+                        return issues
 
         return issues
 
     @staticmethod
-    def _validate_output_channels(export_spec: ExportSpec) -> List[ValidationIssue]:
-        """Validate output channel configuration."""
-        issues = []
+    def clear_cache() -> None:
+        """Drop cached validation results (e.g. after sequences are rescanned)."""
+        _STAGE_CACHE.clear()
+        _PATH_CHECK_CACHE.clear()
 
+    @staticmethod
+    def _validate_output_channels(export_spec: ExportSpec) -> Iterator[ValidationIssue]:
+        """Validate output channel configuration."""
         # At least one output channel
         if not export_spec.output_channels:
-            issues.append(
-                ValidationIssue(
-                    severity=ValidationSeverity.ERROR,
-                    code="NO_OUTPUT_CHANNELS",
-                    message="At least one output channel must be selected.",
-                    context={},
-                )
+            yield ValidationIssue(
+                severity=ValidationSeverity.ERROR,
+                code="NO_OUTPUT_CHANNELS",
+                message="At least one output channel must be selected.",
+                context={},
             )
-            return issues
+            return
 
         # Unique channel names
-        names = [ch.output_name for ch in export_spec.output_channels]
-        if len(names) != len(set(names)):
-            duplicates = [n for n in names if names.count(n) > 1]
-            issues.append(
-                ValidationIssue(
-                    severity=ValidationSeverity.ERROR,
-                    code="DUPLICATE_CHANNEL_NAMES",
-                    message=f"Duplicate output channel names: {set(duplicates)}",
-                    context={"duplicates": list(set(duplicates))},
-                )
+        counts = Counter(ch.output_name for ch in export_spec.output_channels)
+        duplicates = [n for n, c in counts.items() if c > 1]
+        if duplicates:
+            yield ValidationIssue(
+                severity=ValidationSeverity.ERROR,
+                code="DUPLICATE_CHANNEL_NAMES",
+                message=f"Duplicate output channel names: {set(duplicates)}",
+                context={"duplicates": duplicates},
             )
 
         # All channels have valid source references
         for ch in export_spec.output_channels:
             if not ch.source:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="MISSING_CHANNEL_SOURCE",
-                        message=f"Output channel '{ch.output_name}' has no source reference.",
-                        context={"channel_name": ch.output_name},
-                    )
+                yield ValidationIssue(
+                    severity=ValidationSeverity.ERROR,
+                    code="MISSING_CHANNEL_SOURCE",
+                    message=f"Output channel '{ch.output_name}' has no source reference.",
+                    context={"channel_name": ch.output_name},
                 )
 
-        return issues
-
     @staticmethod
     def _validate_channel_formats(
         export_spec: ExportSpec,
         sequences: dict[str, SequenceSpec],
-    ) -> List[ValidationIssue]:
+    ) -> Iterator[ValidationIssue]:
         """Validate channel format compatibility."""
-        issues = []
-
         # All output channels must have consistent resolution
         # (unless resize is enabled to normalize inputs)
-        from ..core import ResizePolicy
+        resize_enabled = export_spec.resize_spec.policy != ResizePolicy.NONE
         
-        resolutions = set()
-        for ch in export_spec.output_channels:
-            if not ch.source:
-                continue
+        # Only the first two distinct resolutions matter for the check
+        first_res = None
+        mismatched = None
 
-            seq = sequences.get(ch.source.sequence_id)
-            if not seq or not seq.static_probe:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="MISSING_SEQUENCE",
-                        message=f"Sequence '{ch.source.sequence_id}' not found.",
-                        context={"sequence_id": ch.source.sequence_id},
-                    )
-                )
+        # Sequence lookups and per-(sequence, subimage) channel name indexes
+        # are resolved once and shared by every channel referencing them
+        seq_cache: dict[str, Optional[SequenceSpec]] = {}
+        probe_index: dict[tuple[str, int], dict[str, ChannelSpec]] = {}
+
+        # Single pass: sequence presence, resolution, and source channel checks
+        for ch in export_spec.output_channels:
+            source = ch.source
+            if not source:
                 continue
 
-            spec = seq.static_probe.main_subimage
-            if spec:
-                resolutions.add((spec.spec.width, spec.spec.height))
+            seq_id = source.sequence_id
+            if seq_id in seq_cache:
+                seq = seq_cache[seq_id]
+            else:
+                seq = seq_cache[seq_id] = sequences.get(seq_id)
 
-        # Only enforce resolution consistency if resize is disabled
-        if len(resolutions) > 1 and export_spec.resize_spec.policy == ResizePolicy.NONE:
-            issues.append(
-                ValidationIssue(
+            if not seq or not seq.static_probe:
+                yield ValidationIssue(
                     severity=ValidationSeverity.ERROR,
-                    code="INCONSISTENT_RESOLUTION",
-                    message=f"Output channels have different resolutions: {resolutions}",
-                    context={"resolutions": list(resolutions)},
+                    code="MISSING_SEQUENCE",
+                    message=f"Sequence '{seq_id}' not found.",
+                    context={"sequence_id": seq_id},
                 )
-            )
+                continue
 
-        # No implicit type conversions (phase-1 strict)
-        for ch in export_spec.output_channels:
-            if not ch.source or ch.override_format:
+            if not resize_enabled and not mismatched:
+                spec = seq.static_probe.main_subimage
+                if spec:
+                    res = (spec.spec.width, spec.spec.height)
+                    if first_res is None:
+                        first_res = res
+                    elif res != first_res:
+                        mismatched = res
+
+            # No implicit type conversions (phase-1 strict)
+            if ch.override_format:
                 # Override allowed; skip check
                 continue
 
-            seq = sequences.get(ch.source.sequence_id)
-            if not seq or not seq.static_probe:
-                continue
+            key = (seq_id, source.subimage_index)
+            channels = probe_index.get(key)
+            if channels is None:
+                channels = _probe_channel_index(seq.static_probe, source.subimage_index)
+                probe_index[key] = channels
 
-            src_channel = _find_channel_in_probe(
-                seq.static_probe,
-                ch.source.channel_name,
-                ch.source.subimage_index,
-            )
-            if not src_channel:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="SOURCE_CHANNEL_NOT_FOUND",
-                        message=f"Channel '{ch.source.channel_name}' not found in sequence '{ch.source.sequence_id}'.",
-                        context={
-                            "sequence_id": ch.source.sequence_id,
-                            "channel_name": ch.source.channel_name,
-                        },
-                    )
+            if source.channel_name not in channels:
+                yield ValidationIssue(
+                    severity=ValidationSeverity.ERROR,
+                    code="SOURCE_CHANNEL_NOT_FOUND",
+                    message=f"Channel '{source.channel_name}' not found in sequence '{seq_id}'.",
+                    context={
+                        "sequence_id": seq_id,
+                        "channel_name": source.channel_name,
+                    },
                 )
 
-        return issues
+        # Only enforce resolution consistency if resize is disabled
+        if mismatched:
+            resolutions = [first_res, mismatched]
+            yield ValidationIssue(
+                severity=ValidationSeverity.ERROR,
+                code="INCONSISTENT_RESOLUTION",
+                message=f"Output channels have different resolutions: {resolutions}",
+                context={"resolutions": resolutions},
+            )
 
     @staticmethod
-    def _validate_export_path(export_spec: ExportSpec) -> List[ValidationIssue]:
+    def _validate_export_path(export_spec: ExportSpec) -> Iterator[ValidationIssue]:
         """Validate output path and filename pattern."""
-        issues = []
-
         if not export_spec.output_dir:
-            issues.append(
-                ValidationIssue(
-                    severity=ValidationSeverity.ERROR,
-                    code="MISSING_OUTPUT_DIR",
-                    message="Output directory not specified.",
-                    context={},
-                )
+            yield ValidationIssue(
+                severity=ValidationSeverity.ERROR,
+                code="MISSING_OUTPUT_DIR",
+                message="Output directory not specified.",
+                context={},
             )
-            return issues
+            return
 
-        output_path = Path(export_spec.output_dir)
-        if not output_path.exists():
+        output_dir = export_spec.output_dir
+        if output_dir not in _PATH_CHECK_CACHE:
             try:
-                output_path.mkdir(parents=True, exist_ok=True)
+                os.makedirs(output_dir, exist_ok=True)
+                _PATH_CHECK_CACHE.add(output_dir)
             except Exception as e:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="CANNOT_CREATE_OUTPUT_DIR",
-                        message=f"Cannot create output directory: {e}",
-                        context={"error": str(e)},
-                    )
+                yield ValidationIssue(
+                    severity=ValidationSeverity.ERROR,
+                    code="CANNOT_CREATE_OUTPUT_DIR",
+                    message=f"Cannot create output directory: {e}",
+                    context={"error": str(e)},
                 )
 
         # Filename pattern must include frame token
         pattern = export_spec.filename_pattern
-        if "%04d" not in pattern and "####" not in pattern:
-            issues.append(
-                ValidationIssue(
-                    severity=ValidationSeverity.WARNING,
-                    code="NO_FRAME_TOKEN",
-                    message="Filename pattern has no frame token (%04d or ####). Will overwrite same file for each frame.",
-                    context={"pattern": pattern},
-                )
+        if not _FRAME_TOKEN_RE.search(pattern):
+            yield ValidationIssue(
+                severity=ValidationSeverity.WARNING,
+                code="NO_FRAME_TOKEN",
+                message="Filename pattern has no frame token (e.g. %04d or ####). Will overwrite same file for each frame.",
+                context={"pattern": pattern},
             )
 
-        return issues
-
     @staticmethod
     def _validate_sequence_policy(
         export_spec: ExportSpec,
         sequences: dict[str, SequenceSpec],
-    ) -> List[ValidationIssue]:
+    ) -> Iterator[ValidationIssue]:
         """Validate frame range policy."""
-        issues = []
-
         if not export_spec.frame_policy:
-            issues.append(
-                ValidationIssue(
-                    severity=ValidationSeverity.ERROR,
-                    code="NO_FRAME_POLICY",
-                    message="Frame range policy not selected.",
-                    context={},
-                )
+            yield ValidationIssue(
+                severity=ValidationSeverity.ERROR,
+                code="NO_FRAME_POLICY",
+                message="Frame range policy not selected.",
+                context={},
             )
 
         # Warn if sequences have different lengths
+        if len(sequences) < 2:
+            return
+
         frame_counts = {}
+        first = None
+        diverge = False
         for seq in sequences.values():
-            frame_counts[seq.id] = len(seq.frames)
-
-        if len(set(frame_counts.values())) > 1:
-            issues.append(
-                ValidationIssue(
-                    severity=ValidationSeverity.WARNING,
-                    code="SEQUENCE_LENGTH_MISMATCH",
-                    message=f"Sequences have different frame counts: {frame_counts}. Frame policy: {export_spec.frame_policy.name}",
-                    context={"frame_counts": frame_counts},
-                )
+            n = len(seq.frames)
+            frame_counts[seq.id] = n
+            if first is None:
+                first = n
+            elif n != first:
+                diverge = True
+
+        if diverge:
+            yield ValidationIssue(
+                severity=ValidationSeverity.WARNING,
+                code="SEQUENCE_LENGTH_MISMATCH",
+                message=f"Sequences have different frame counts: {frame_counts}. Frame policy: {export_spec.frame_policy.name}",
+                context={"frame_counts": frame_counts},
             )
 
-        return issues
-
     @staticmethod
-    def _validate_attributes(export_spec: ExportSpec) -> List[ValidationIssue]:
+    def _validate_attributes(export_spec: ExportSpec) -> Iterator[ValidationIssue]:
         """Validate output attributes."""
-        issues = []
-
         # Check for obviously invalid attribute types
         for attr in export_spec.output_attributes.attributes:
             if not attr.name:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="EMPTY_ATTRIBUTE_NAME",
-                        message="Attribute has empty name.",
-                        context={},
-                    )
+                yield ValidationIssue(
+                    severity=ValidationSeverity.ERROR,
+                    code="EMPTY_ATTRIBUTE_NAME",
+                    message="Attribute has empty name.",
+                    context={},
                 )
 
             if attr.value is None and attr.editable:
                 # Warn about None values (may be okay depending on OIIO semantics)
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.WARNING,
-                        code="NULL_ATTRIBUTE_VALUE",
-                        message=f"Attribute '{attr.name}' has None value.",
-                        context={"attribute_name": attr.name},
-                    )
+                yield ValidationIssue(
+                    severity=ValidationSeverity.WARNING,
+                    code="NULL_ATTRIBUTE_VALUE",
+                    message=f"Attribute '{attr.name}' has None value.",
+                    context={"attribute_name": attr.name},
                 )
 
-        return issues
+
+def _cached_stage(stage, args, fingerprint) -> tuple[ValidationIssue, ...]:
+    """Run a pure validation stage, reusing its result for unchanged inputs."""
+    key = (stage.__name__,) + fingerprint
+    cached = _STAGE_CACHE.get(key)
+    if cached is not None:
+        _STAGE_CACHE.move_to_end(key)
+        return cached
+
+    result = tuple(stage(*args))
+    _STAGE_CACHE[key] = result
+    if len(_STAGE_CACHE) > _STAGE_CACHE_SIZE:
+        _STAGE_CACHE.popitem(last=False)
+    return result
 
 
-def _find_channel_in_probe(probe, channel_name: str, subimage_index: int):
-    """Find a channel in a FileProbe by name and subimage."""
+def _probe_channel_index(probe, subimage_index: int) -> dict[str, ChannelSpec]:
+    """Map channel name -> ChannelSpec for one subimage of a FileProbe."""
     if subimage_index >= len(probe.subimages):
-        return None
-    subimage = probe.subimages[subimage_index]
-    for ch in subimage.channels:
-        if ch.name == channel_name:
-            return ch
-    return None
+        return {}
+    return {ch.name: ch for ch in reversed(probe.subimages[subimage_index].channels)}
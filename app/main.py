@@ -4,18 +4,23 @@ EXR Toolkit — Main Entry Point
 Run this to start the GUI application.
 """
 
+import logging
 import sys
-from PySide6.QtWidgets import QApplication
-
-from app.ui.main_window import MainWindow
-from app.oiio import OiioAdapter
 
 
 def main():
     """Launch the application."""
+    # GUI and OIIO stacks are imported here so importing this module stays cheap
+    from PySide6.QtWidgets import QApplication
+
+    from app.ui.main_window import MainWindow
+    from app.oiio import OiioAdapter
+
+    logging.basicConfig(level=logging.INFO, format="[%(name)s] %(message)s")
+    logger = logging.getLogger(__name__)
+
     # Verify OIIO
-    oiio_version = OiioAdapter.get_oiio_version()
-    print(f"OpenImageIO version: {oiio_version}")
+    logger.info("OpenImageIO version: %s", OiioAdapter.get_oiio_version())
 
     # Create Qt application
     app = QApplication(sys.argv)
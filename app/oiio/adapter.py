@@ -5,6 +5,9 @@ Handles API differences across OIIO versions and normalizes
 spec/attribute enumeration.
 """
 
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Any, Tuple
 import OpenImageIO as oiio
 
@@ -19,6 +22,40 @@ from ..core import (
     FileProbe,
 )
 
+logger = logging.getLogger(__name__)
+
+# Binding capabilities, resolved once instead of per subimage
+_HAS_CHNAMES = hasattr(oiio.ImageSpec, 'channelnames')
+_HAS_CHFORMATS = hasattr(oiio.ImageSpec, 'channelformats')
+_HAS_FORMAT = hasattr(oiio.ImageSpec, 'format')
+_HAS_TILE = hasattr(oiio.ImageSpec, 'tile_width')
+_HAS_EXTRA_ATTRIBS = hasattr(oiio.ImageSpec, 'extra_attribs')
+_OIIO_VERSION = str(getattr(oiio, '__version__', 'unknown'))
+
+# Common EXR attributes queried by name when extra_attribs is unavailable
+_COMMON_ATTRS = (
+    "compression",
+    "lineOrder",
+    "pixelAspectRatio",
+    "expTime",
+    "renderingTransform",
+    "displayWindow",
+    "dataWindow",
+    "openexr:lineOrder",
+    "openexr:compressionType",
+)
+
+# Shared ChannelFormat per type string; probes only ever see a handful
+_CHANNEL_FORMAT_CACHE: dict[str, ChannelFormat] = {}
+
+
+def _cf(fmt_str: str) -> ChannelFormat:
+    """Return the interned (frozen) ChannelFormat for an OIIO type string."""
+    fmt = _CHANNEL_FORMAT_CACHE.get(fmt_str)
+    if fmt is None:
+        fmt = _CHANNEL_FORMAT_CACHE.setdefault(fmt_str, ChannelFormat(oiio_type=fmt_str))
+    return fmt
+
 
 class OiioAdapter:
     """Thin wrapper for robust OIIO bindings."""
@@ -34,41 +71,74 @@ class OiioAdapter:
             if not inp:
                 return None
 
-            subimages = []
-            subimage_idx = 0
+            spec = inp.spec()
+            # Multi-part files advertise their part count up front
+            nsubimages = spec.get_int_attribute("oiio:subimages", 0) if spec else 0
 
-            while True:
-                spec = inp.spec()
-                if not spec:
-                    break
+            if nsubimages > 0:
+                subimages = [None] * nsubimages
+                for subimage_idx in range(nsubimages):
+                    if subimage_idx and not inp.seek_subimage(subimage_idx, 0):
+                        del subimages[subimage_idx:]
+                        break
+                    subimages[subimage_idx] = OiioAdapter._probe_subimage(
+                        inp.spec(), subimage_idx
+                    )
+            else:
+                subimages = []
+                subimage_idx = 0
 
-                subimage = OiioAdapter._probe_subimage(spec, subimage_idx)
-                subimages.append(subimage)
+                while spec:
+                    subimage = OiioAdapter._probe_subimage(spec, subimage_idx)
+                    subimages.append(subimage)
 
-                # Try to move to next subimage
-                if not inp.seek_subimage(subimage_idx + 1, 0):
-                    break
-                subimage_idx += 1
+                    # Try to move to next subimage
+                    if not inp.seek_subimage(subimage_idx + 1, 0):
+                        break
+                    subimage_idx += 1
+                    spec = inp.spec()
 
             inp.close()
             return FileProbe(path=filepath, subimages=subimages)
 
         except Exception as e:
-            print(f"[OIIO] Error probing {filepath}: {e}")
+            logger.warning("Error probing %s: %s", filepath, e)
             return None
 
+    @staticmethod
+    def probe_files(
+        filepaths: List[str], max_workers: Optional[int] = None
+    ) -> List[Optional[FileProbe]]:
+        """
+        Probe several files concurrently; results are in input order.
+
+        OIIO releases the GIL during native file I/O, so threads overlap
+        the header reads. Entries are None where probe_file failed.
+        """
+        if len(filepaths) <= 1:
+            return [OiioAdapter.probe_file(fp) for fp in filepaths]
+
+        workers = min(max_workers or os.cpu_count() or 1, len(filepaths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(OiioAdapter.probe_file, filepaths))
+
     @staticmethod
     def _probe_subimage(spec: oiio.ImageSpec, subimage_idx: int) -> SubImageProbe:
         """Extract channel and attribute data from a single subimage."""
         
+        # Channel names/formats are copied out of the binding once and shared
+        channel_names, channel_formats = OiioAdapter._fetch_spec_arrays(spec)
+        
         # Extract channel information
-        channels = OiioAdapter._extract_channels(spec, subimage_idx)
+        channels = OiioAdapter._extract_channels(
+            channel_names, channel_formats, subimage_idx
+        )
         
         # Extract attributes
         attributes = OiioAdapter._extract_attributes(spec)
         
         # Create spec snapshot
-        spec_snapshot = OiioAdapter._snapshot_spec(spec)
+        spec_snapshot = OiioAdapter._snapshot_spec(spec, channel_names, channel_formats)
         
         return SubImageProbe(
             spec=spec_snapshot,
@@ -77,30 +147,35 @@ class OiioAdapter:
         )
 
     @staticmethod
-    def _extract_channels(spec: oiio.ImageSpec, subimage_idx: int) -> List[ChannelSpec]:
-        """Extract channel list from spec."""
-        channels = []
-        
-        # Get channel names
-        channel_names = spec.channelnames if hasattr(spec, 'channelnames') else []
+    def _fetch_spec_arrays(spec: oiio.ImageSpec) -> Tuple[List[str], List[str]]:
+        """Return (channel names, per-channel format strings) for a spec."""
+        channel_names = list(spec.channelnames) if _HAS_CHNAMES else []
         if not channel_names:
             # Fallback: generic channel names
-            nchannels = spec.nchannels
-            channel_names = [f"channel{i}" for i in range(nchannels)]
+            channel_names = [f"channel{i}" for i in range(spec.nchannels)]
         
-        # Get channel formats (per-channel OIIO types)
-        channel_formats = spec.channelformats if hasattr(spec, 'channelformats') else []
-        if not channel_formats and hasattr(spec, 'format'):
-            # Fallback: all channels same format
-            channel_formats = [str(spec.format)] * len(channel_names)
+        # Per-channel OIIO types; empty when all channels share spec.format
+        channel_formats = (
+            [str(f) for f in spec.channelformats] if _HAS_CHFORMATS else []
+        )
+        if not channel_formats:
+            fmt_str = str(spec.format) if _HAS_FORMAT else "unknown"
+            channel_formats = [fmt_str] * len(channel_names)
+        
+        return channel_names, channel_formats
+
+    @staticmethod
+    def _extract_channels(
+        channel_names: List[str], channel_formats: List[str], subimage_idx: int
+    ) -> List[ChannelSpec]:
+        """Build the channel list from fetched spec arrays."""
+        channels = []
         
         for i, ch_name in enumerate(channel_names):
             fmt_str = channel_formats[i] if i < len(channel_formats) else "unknown"
-            fmt = ChannelFormat(oiio_type=fmt_str)
-            
             channels.append(ChannelSpec(
                 name=ch_name,
-                format=fmt,
+                format=_cf(fmt_str),
                 subimage_index=subimage_idx,
             ))
         
@@ -110,11 +185,12 @@ class OiioAdapter:
     def _extract_attributes(spec: oiio.ImageSpec) -> AttributeSet:
         """Extract all attributes from spec."""
         attributes = AttributeSet()
+        seen: set[str] = set()
         
         # Try different ways to enumerate attributes depending on OIIO version
         
         # Method 1: extra_attribs (newer OIIO)
-        if hasattr(spec, 'extra_attribs'):
+        if _HAS_EXTRA_ATTRIBS:
             for attr in spec.extra_attribs:
                 try:
                     attr_spec = AttributeSpec(
@@ -125,61 +201,44 @@ class OiioAdapter:
                         editable=True,
                     )
                     attributes.add_or_update(attr_spec)
+                    seen.add(attr_spec.name)
                 except Exception:
                     pass
+
+            # extra_attribs already lists every attribute; no need to re-query
+            if seen:
+                return attributes
         
         # Method 2: Use attrib() getter (fallback for specific known attributes)
-        # This is a manual list of common EXR attributes to check
-        common_attrs = [
-            "compression",
-            "lineOrder",
-            "pixelAspectRatio",
-            "expTime",
-            "renderingTransform",
-            "displayWindow",
-            "dataWindow",
-            "openexr:lineOrder",
-            "openexr:compressionType",
-        ]
-        
-        for attr_name in common_attrs:
-            try:
+        # getattribute returns None for missing names, so one try suffices
+        try:
+            for attr_name in _COMMON_ATTRS:
                 val = spec.getattribute(attr_name)
-                if val is not None:
-                    attr_spec = AttributeSpec(
+                if val is not None and attr_name not in seen:
+                    attributes.add_or_update(AttributeSpec(
                         name=attr_name,
                         oiio_type="mixed",
                         value=val,
                         source=AttributeSource.INPUT_SEQ,
                         editable=True,
-                    )
-                    # Only add if not already in set
-                    if attributes.get_by_name(attr_name) is None:
-                        attributes.add_or_update(attr_spec)
-            except Exception:
-                pass
+                    ))
+        except Exception:
+            pass
         
         return attributes
 
     @staticmethod
-    def _snapshot_spec(spec: oiio.ImageSpec) -> ImageSpecSnapshot:
+    def _snapshot_spec(
+        spec: oiio.ImageSpec, channel_names: List[str], channel_formats: List[str]
+    ) -> ImageSpecSnapshot:
         """Create an immutable snapshot of critical spec fields."""
         
         width = spec.width
         height = spec.height
         nchannels = spec.nchannels
         
-        channel_names = list(spec.channelnames) if hasattr(spec, 'channelnames') else []
-        if not channel_names:
-            channel_names = [f"channel{i}" for i in range(nchannels)]
-        
-        channel_formats = list(spec.channelformats) if hasattr(spec, 'channelformats') else []
-        if not channel_formats:
-            fmt_str = str(spec.format) if hasattr(spec, 'format') else "unknown"
-            channel_formats = [fmt_str] * len(channel_names)
-        
-        tile_width = spec.tile_width if hasattr(spec, 'tile_width') else 0
-        tile_height = spec.tile_height if hasattr(spec, 'tile_height') else 0
+        tile_width = spec.tile_width if _HAS_TILE else 0
+        tile_height = spec.tile_height if _HAS_TILE else 0
         
         return ImageSpecSnapshot(
             width=width,
@@ -189,7 +248,7 @@ class OiioAdapter:
             channelformats=channel_formats,
             tile_width=tile_width,
             tile_height=tile_height,
-            format=str(spec.format) if hasattr(spec, 'format') else "unknown",
+            format=str(spec.format) if _HAS_FORMAT else "unknown",
         )
 
     @staticmethod
@@ -220,13 +279,7 @@ class OiioAdapter:
     @staticmethod
     def get_oiio_version() -> str:
         """Return OIIO version string."""
-        try:
-            # Try common version attributes
-            if hasattr(oiio, '__version__'):
-                return str(oiio.__version__)
-        except Exception:
-            pass
-        return "unknown"
+        return _OIIO_VERSION
     @staticmethod
     def resize_image(filepath: str, target_width: int, target_height: int, 
                     algorithm: str = "lanczos3") -> Optional[oiio.ImageBuf]:
@@ -261,5 +314,5 @@ class OiioAdapter:
             return dst if dst and dst.initialized() else None
         
         except Exception as e:
-            print(f"[OIIO] Error resizing {filepath}: {e}")
+            logger.warning("Error resizing %s: %s", filepath, e)
             return None
\ No newline at end of file
@@ -6,33 +6,49 @@ during export. Filters are stored as configurations and applied sequentially
 via OpenImageIO's ImageBufAlgo.
 """
 
-from .pipeline import ProcessingPipeline
-from .filters import (
-    ProcessingFilter,
-    FilterParameter,
-    ParameterType,
-    MedianFilter,
-    UnsharpMaskFilter,
-    ColorSpaceConversionFilter,
-    BrightnessContrastFilter,
-    GammaCorrectionFilter,
-    FillHolesFilter,
-    FixNonFiniteFilter,
-    WarpTransformFilter,
-    RotateFilter,
-    NoiseInjectionFilter,
-    DilateFilter,
-    ErodeFilter,
-    ChannelExtractFilter,
-    ChannelInvertFilter,
-)
-from .executor import ProcessingExecutor
-from .filters import (
-    create_filter,
-    get_filters_by_category,
-    get_all_categories,
-    FILTER_REGISTRY,
-)
+import importlib
+
+# Public name -> submodule; resolved on first attribute access (PEP 562)
+# so importing the package does not load every filter implementation.
+_LAZY_IMPORTS = {
+    "ProcessingPipeline": ".pipeline",
+    "ProcessingExecutor": ".executor",
+    "ProcessingFilter": ".filters",
+    "FilterParameter": ".filters",
+    "ParameterType": ".filters",
+    "MedianFilter": ".filters",
+    "UnsharpMaskFilter": ".filters",
+    "ColorSpaceConversionFilter": ".filters",
+    "BrightnessContrastFilter": ".filters",
+    "GammaCorrectionFilter": ".filters",
+    "FillHolesFilter": ".filters",
+    "FixNonFiniteFilter": ".filters",
+    "WarpTransformFilter": ".filters",
+    "RotateFilter": ".filters",
+    "NoiseInjectionFilter": ".filters",
+    "DilateFilter": ".filters",
+    "ErodeFilter": ".filters",
+    "ChannelExtractFilter": ".filters",
+    "ChannelInvertFilter": ".filters",
+    "create_filter": ".filters",
+    "get_filters_by_category": ".filters",
+    "get_all_categories": ".filters",
+    "FILTER_REGISTRY": ".filters",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "ProcessingPipeline",
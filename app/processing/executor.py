@@ -5,7 +5,15 @@ This module bridges the processing pipeline to OIIO's ImageBufAlgo
 functions, handling the actual image processing operations.
 """
 
-from typing import Optional
+import math
+import os
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+import numpy as np
 import OpenImageIO as oiio
 
 from .pipeline import ProcessingPipeline
@@ -27,10 +35,284 @@ from .filters import (
     ChannelInvertFilter,
 )
 
+# ImageBufAlgo entry points, bound once instead of looked up per call
+_IBA = oiio.ImageBufAlgo
+_add = _IBA.add
+_mul = _IBA.mul
+_mad = getattr(_IBA, 'mad', None)  # multiply-add in one pass; missing from very old bindings
+_pow = _IBA.pow
+_median = _IBA.median_filter
+_unsharp = _IBA.unsharp_mask
+_colorconvert = _IBA.colorconvert
+_fillholes = _IBA.fillholes_pushpull
+_fix_non_finite = _IBA.fixNonFinite
+_warp = _IBA.warp
+_rotate = _IBA.rotate
+# Clockwise quarter turns by angle in degrees (rotate is clockwise too)
+_QUARTER_TURNS = {90: _IBA.rotate90, 180: _IBA.rotate180, 270: _IBA.rotate270}
+_dilate = _IBA.dilate
+_erode = _IBA.erode
+_channels = _IBA.channels
+_pixel_stats = _IBA.computePixelStats
+_copy = _IBA.copy
+_noise = _IBA.noise
+
+# Fixed per-channel operands, built once
+_IDENTITY_M = (1, 0, 0, 0, 1, 0, 0, 0, 1)
+_INVERT_TERMS = ((-1.0, -1.0, -1.0, -1.0), (1.0, 1.0, 1.0, 1.0))
+
+
+@lru_cache(maxsize=64)
+def _rgb(value: float, alpha: float) -> tuple[float, float, float, float]:
+    """(value, value, value, alpha) operand; parameters repeat across frames."""
+    return (value, value, value, alpha)
+
+
+def _affine_terms(filter: ProcessingFilter) -> Optional[tuple[tuple, tuple]]:
+    """
+    Return per-channel (scale, bias) if the filter is a pure pixel-wise
+    affine map, else None.
+    """
+    if isinstance(filter, BrightnessContrastFilter):
+        brightness_param = filter.get_parameter("brightness")
+        contrast_param = filter.get_parameter("contrast")
+        if not brightness_param or not contrast_param:
+            return None
+        brightness = brightness_param.value
+        contrast = contrast_param.value
+        # Contrast ((pixel - 0.5) * contrast + 0.5) followed by brightness
+        # (multiply) folds into pixel * scale + bias; alpha untouched
+        scale = brightness * contrast
+        bias = brightness * (0.5 - 0.5 * contrast)
+        return _rgb(scale, 1.0), _rgb(bias, 0.0)
+    
+    if isinstance(filter, ChannelInvertFilter):
+        # Only "all channels" is image-independent; a channel subset is
+        # resolved against the image's channel names by its handler
+        channels_param = filter.get_parameter("channels")
+        if channels_param and not channels_param.value.strip():
+            return _INVERT_TERMS
+        return None
+    
+    return None
+
+
+def _compose_affine(first: tuple[tuple, tuple], second: tuple[tuple, tuple]) -> tuple[tuple, tuple]:
+    """Compose two affine maps: second(first(x)) = (s2*s1)*x + (s2*b1 + b2)."""
+    (s1, b1), (s2, b2) = first, second
+    return (
+        tuple(a * b for a, b in zip(s2, s1)),
+        tuple(a * b + c for a, b, c in zip(s2, b1, b2)),
+    )
+
+
+# Filters whose handlers keep the source layout and accept a `dst` buffer
+_DST_FILTERS = frozenset((
+    MedianFilter,
+    UnsharpMaskFilter,
+    GammaCorrectionFilter,
+    FillHolesFilter,
+    FixNonFiniteFilter,
+    DilateFilter,
+    ErodeFilter,
+    ChannelInvertFilter,
+    NoiseInjectionFilter,
+    ColorSpaceConversionFilter,
+))
+
+
+# Bytes of scanlines per band in _execute_blocked: small enough to stay in
+# cache across steps, large enough to keep OIIO's worker threads busy
+_BLOCK_BYTES = 4 << 20
+
+
+def _affine_is_identity(terms: tuple[tuple, tuple]) -> bool:
+    """True if (scale, bias) leaves every channel unchanged."""
+    scale, bias = terms
+    return all(v == 1 for v in scale) and not any(bias)
+
+
+def _kernel(filter: ProcessingFilter) -> tuple:
+    """(kernel_width, kernel_height) parameter values of a filter."""
+    width = filter.get_parameter("kernel_width")
+    height = filter.get_parameter("kernel_height")
+    return (width.value if width else None, height.value if height else None)
+
+
+def _morphology_pair(step: tuple, filter: ProcessingFilter) -> bool:
+    """True if a single-filter step and filter form a same-kernel open/close."""
+    filters, terms = step
+    if terms is not None or len(filters) != 1:
+        return False
+    kinds = {type(filters[0]), type(filter)}
+    return kinds == {DilateFilter, ErodeFilter} and _kernel(filters[0]) == _kernel(filter)
+
+
+def _color_conversion(filter: ColorSpaceConversionFilter) -> tuple[str, str, bool]:
+    """(from_space, to_space, unpremult) of a color space conversion filter."""
+    from_param = filter.get_parameter("from_space")
+    to_param = filter.get_parameter("to_space")
+    unpremult_param = filter.get_parameter("unpremult")
+    
+    if not all([from_param, to_param, unpremult_param]):
+        raise ValueError("Missing color space conversion parameters")
+    
+    from_space = from_param.value
+    to_space = to_param.value
+    unpremult = unpremult_param.value
+    
+    if from_space is None or to_space is None or unpremult is None:
+        raise ValueError("Color space conversion parameters have no value")
+    
+    return from_space, to_space, unpremult
+
+
+def _color_chain(step: tuple, filter: ProcessingFilter) -> bool:
+    """True if filter continues a step of color conversions (A->B then B->C)."""
+    filters, terms = step
+    if (
+        terms is not None
+        or type(filter) is not ColorSpaceConversionFilter
+        or any(type(f) is not ColorSpaceConversionFilter for f in filters)
+    ):
+        return False
+    try:
+        _, last_to, unpremult = _color_conversion(filters[-1])
+        next_from, _, next_unpremult = _color_conversion(filter)
+    except ValueError:
+        return False
+    return last_to == next_from and unpremult == next_unpremult
+
+
+def _reusable(spare: Optional[oiio.ImageBuf], src: oiio.ImageBuf) -> Optional[oiio.ImageBuf]:
+    """Return spare if it has src's exact layout (window, channels, format)."""
+    if spare is None or spare.roi != src.roi or spare.spec().format != src.spec().format:
+        return None
+    return spare
+
+
+def _run_into(
+    dst: Optional[oiio.ImageBuf],
+    op,
+    *args,
+    roi: Optional[oiio.ROI] = None,
+    **kwargs,
+) -> oiio.ImageBuf:
+    """
+    Run an ImageBufAlgo op writing into dst (reusing its pixel memory), or
+    return the op's newly allocated result when no dst is given. The op is
+    restricted to roi when one is given.
+    """
+    kwargs["roi"] = roi if roi is not None else oiio.ROI.All
+    if dst is None:
+        return op(*args, **kwargs)
+    if not op(dst, *args, **kwargs):
+        raise RuntimeError(dst.geterror() or f"{op.__name__} failed")
+    return dst
+
+
+def _morphology(
+    dst: Optional[oiio.ImageBuf],
+    op,
+    imagebuf: oiio.ImageBuf,
+    width: int,
+    height: int,
+    roi: Optional[oiio.ROI] = None,
+) -> oiio.ImageBuf:
+    """
+    Dilate or erode with a width x height box. A box max/min is separable,
+    so larger boxes run as a 1-row pass then a 1-column pass: O(w + h)
+    per pixel instead of O(w * h), for the price of an extra image pass.
+    """
+    # The row pass would need a halo outside a restricted roi; only split
+    # whole-image calls, and only where the op count clearly wins
+    if roi is None and width > 1 and height > 1 and width * height >= 2 * (width + height):
+        rows = _run_into(None, op, imagebuf, width, 1)
+        return _run_into(dst, op, rows, 1, height)
+    return _run_into(dst, op, imagebuf, width, height, roi=roi)
+
+
+def _parse_channel_list(channels_str: str) -> tuple[str, ...]:
+    """Split a comma-separated channel list ("R, G, B") into names."""
+    return tuple(ch.strip() for ch in channels_str.split(","))
+
+
+def _noise_seed(filter_id: str) -> int:
+    """Deterministic noise seed for a filter, stable across runs."""
+    return zlib.crc32(filter_id.encode()) & 0x7FFFFFFF
+
+
+# Integer pixel types small enough for a full lookup table: (dtype, max value)
+_LUT_TYPES = {
+    oiio.UINT8: (np.uint8, 255),
+    oiio.UINT16: (np.uint16, 65535),
+}
+
+
+@lru_cache(maxsize=16)
+def _gamma_lut(basetype, gamma: float) -> np.ndarray:
+    """Table of round((v / max) ** gamma * max) for every integer level v."""
+    dtype, top = _LUT_TYPES[basetype]
+    levels = np.arange(top + 1, dtype=np.float64) / top
+    return np.rint(levels ** gamma * top).astype(dtype)
+
+
+@lru_cache(maxsize=64)
+def _channel_indices(
+    channelnames: tuple[str, ...], selected: tuple[str, ...]
+) -> Optional[tuple[int, ...]]:
+    """Indices of the selected channel names, or None if one is missing."""
+    position = {name: i for i, name in enumerate(channelnames)}
+    try:
+        return tuple(position[name] for name in selected)
+    except KeyError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _invert_terms(
+    channelnames: tuple[str, ...], selected: tuple[str, ...]
+) -> tuple[tuple, tuple]:
+    """
+    Per-channel (scale, bias) computing 1 - value on the selected channels
+    and leaving the others (typically alpha) untouched. A selected name
+    also matches layer-qualified channels ("R" matches "beauty.R").
+    """
+    wanted = {name for name in selected if name}
+    flags = [
+        not wanted or name in wanted or name.rpartition(".")[2] in wanted
+        for name in channelnames
+    ]
+    return (
+        tuple(-1.0 if f else 1.0 for f in flags),
+        tuple(1.0 if f else 0.0 for f in flags),
+    )
+
 
 class ProcessingExecutor:
     """Executes processing pipeline on ImageBuf objects."""
     
+    def __init__(self):
+        # Per-thread intermediate for fused steps (frames run concurrently)
+        self._scratch = threading.local()
+        # Filter class -> handler, resolved with a single lookup per filter
+        self._dispatch = {
+            MedianFilter: self._apply_median_filter,
+            UnsharpMaskFilter: self._apply_unsharp_mask,
+            ColorSpaceConversionFilter: self._apply_color_space_conversion,
+            BrightnessContrastFilter: self._apply_brightness_contrast,
+            GammaCorrectionFilter: self._apply_gamma_correction,
+            FillHolesFilter: self._apply_fill_holes,
+            FixNonFiniteFilter: self._apply_fix_non_finite,
+            WarpTransformFilter: self._apply_warp_transform,
+            RotateFilter: self._apply_rotate,
+            NoiseInjectionFilter: self._apply_noise_injection,
+            DilateFilter: self._apply_dilate,
+            ErodeFilter: self._apply_erode,
+            ChannelExtractFilter: self._apply_channel_extract,
+            ChannelInvertFilter: self._apply_channel_invert,
+        }
+    
     def execute(
         self,
         imagebuf: oiio.ImageBuf,
@@ -51,11 +333,215 @@ class ProcessingExecutor:
         if not pipeline.enabled or pipeline.is_empty():
             return imagebuf
         
-        result = imagebuf
-        for filter in pipeline.get_enabled_filters():
-            result = self._apply_filter(result, filter, roi)
-            if not result:
-                raise RuntimeError(f"Filter {filter.name} failed to process image")
+        # Parameters are checked once per frame for the whole pipeline
+        is_valid, errors = pipeline.validate_all()
+        if not is_valid:
+            raise ValueError(f"Invalid filter parameters: {errors}")
+        
+        steps = self._plan(pipeline.get_enabled_filters())
+        
+        # Handlers raise on failure; one handler here covers every step
+        step = None
+        try:
+            if (
+                roi is None
+                and _mad is not None
+                and len(steps) > 1
+                and all(terms is not None or filters[0].is_pointwise
+                        for filters, terms in steps)
+            ):
+                return self._execute_blocked(imagebuf, steps)
+            
+            result = imagebuf
+            # Intermediates are ping-ponged: the buffer a step consumed becomes
+            # the destination of a later same-layout step instead of a fresh
+            # allocation. The caller's imagebuf is never written to.
+            spare = None
+            
+            for step in steps:
+                filters, terms = step
+                if result is not imagebuf and (terms is not None or filters[0].is_pointwise):
+                    # Pointwise steps overwrite an intermediate in place (noise,
+                    # for one, then skips copying its input before adding to it)
+                    dst = result
+                else:
+                    dst = _reusable(spare, result)
+                new = self._apply_step(result, step, roi, dst)
+                if new is not result:
+                    if result is not imagebuf:
+                        spare = result
+                    if new is spare:
+                        spare = None
+                    result = new
+            
+            return result
+        
+        except Exception as e:
+            failed = [step] if step is not None else steps
+            name = ", ".join(f.name for filters, _ in failed for f in filters)
+            print(f"[ERROR] Failed to apply filter {name}: {e}")
+            raise RuntimeError(f"Filter {name} failed to process image: {e}") from e
+    
+    def process_sequence(
+        self,
+        frames: Iterable[oiio.ImageBuf],
+        pipeline: ProcessingPipeline,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[oiio.ImageBuf]:
+        """
+        Apply the pipeline to a stream of frames on a thread pool.
+        
+        Results are yielded in input order. ImageBufAlgo releases the GIL,
+        so frames are processed concurrently; at most two per worker are
+        in flight, so a long sequence is never all decoded into memory.
+        """
+        workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for frame in frames:
+                pending.append(pool.submit(self.execute, frame, pipeline))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    @staticmethod
+    def _plan(filters: tuple[ProcessingFilter, ...]) -> list[tuple]:
+        """
+        Turn enabled filters into steps of (filters, terms): the filters a
+        step covers, and the composed (scale, bias) for an affine run.
+        
+        No-op filters are dropped, consecutive affine filters
+        (pixel * scale + bias) are composed into a single step, an
+        adjacent dilate/erode pair with the same kernel becomes one
+        open/close step, and chained color conversions become one.
+        """
+        steps = []
+        pending = None
+        pending_filters = []
+        for filter in filters:
+            # No-op settings (1x1 kernel, zero amount, 0 degree rotation...)
+            # would still cost a full pass and an allocation
+            if filter.is_identity():
+                continue
+            
+            terms = _affine_terms(filter)
+            if terms is not None:
+                pending = terms if pending is None else _compose_affine(pending, terms)
+                pending_filters.append(filter)
+                continue
+            
+            if pending is not None and not _affine_is_identity(pending):
+                steps.append((tuple(pending_filters), pending))
+            pending = None
+            pending_filters = []
+            
+            if steps and _morphology_pair(steps[-1], filter):
+                steps[-1] = ((steps[-1][0][0], filter), None)
+            elif steps and _color_chain(steps[-1], filter):
+                steps[-1] = (steps[-1][0] + (filter,), None)
+            else:
+                steps.append(((filter,), None))
+        
+        if pending is not None and not _affine_is_identity(pending):
+            steps.append((tuple(pending_filters), pending))
+        
+        return steps
+    
+    def _apply_step(
+        self,
+        imagebuf: oiio.ImageBuf,
+        step: tuple,
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
+    ) -> oiio.ImageBuf:
+        """Run one planned step."""
+        filters, terms = step
+        if terms is not None:
+            return self._apply_affine(imagebuf, terms, roi, dst)
+        if len(filters) > 1:
+            if type(filters[0]) is ColorSpaceConversionFilter:
+                return self._convert_color(imagebuf, filters, roi, dst)
+            return self._apply_morphology_pair(imagebuf, *filters, roi, dst)
+        
+        new = self._apply_filter(imagebuf, filters[0], roi, dst)
+        if not new:
+            raise RuntimeError("no image returned")
+        return new
+    
+    def _execute_blocked(self, imagebuf: oiio.ImageBuf, steps: list[tuple]) -> oiio.ImageBuf:
+        """
+        Run a pointwise-only pipeline one band of scanlines at a time.
+        
+        Every step of a band writes into the same output buffer, so the
+        band stays cache-resident across steps instead of each step
+        streaming the whole frame through memory.
+        """
+        spec = imagebuf.spec()
+        full = imagebuf.roi
+        result = oiio.ImageBuf(spec)
+        
+        row_bytes = max(1, full.width * spec.nchannels * spec.format.size())
+        rows = max(1, _BLOCK_BYTES // row_bytes)
+        
+        changed = False
+        for y in range(full.ybegin, full.yend, rows):
+            band = oiio.ROI(
+                full.xbegin, full.xend, y, min(y + rows, full.yend),
+                full.zbegin, full.zend, full.chbegin, full.chend,
+            )
+            src = imagebuf
+            for step in steps:
+                src = self._apply_step(src, step, band, result)
+            if src is imagebuf:
+                # Every step was a no-op for this band; carry it over unchanged
+                _run_into(result, _copy, imagebuf, roi=band)
+            else:
+                changed = True
+        
+        # Every step turned out to be a no-op for the whole image
+        return result if changed else imagebuf
+    
+    def _apply_morphology_pair(
+        self,
+        imagebuf: oiio.ImageBuf,
+        first: ProcessingFilter,
+        second: ProcessingFilter,
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
+    ) -> oiio.ImageBuf:
+        """
+        Morphological close (dilate, erode) or open (erode, dilate).
+        
+        The intermediate goes into a per-thread scratch buffer kept across
+        frames, so the pair allocates at most its output.
+        """
+        scratch = _reusable(getattr(self._scratch, "buf", None), imagebuf)
+        mid = self._apply_filter(imagebuf, first, roi, scratch)
+        self._scratch.buf = mid
+        return self._apply_filter(mid, second, roi, dst)
+    
+    def _apply_affine(
+        self,
+        imagebuf: oiio.ImageBuf,
+        terms: tuple[tuple, tuple],
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
+    ) -> oiio.ImageBuf:
+        """Apply a (fused) per-channel pixel * scale + bias in one pass."""
+        if _affine_is_identity(terms):
+            return imagebuf
+        
+        scale, bias = terms
+        
+        if _mad is not None:
+            result = _run_into(dst, _mad, imagebuf, scale, bias, roi=roi)
+        else:
+            scaled = _run_into(None, _mul, imagebuf, scale, roi=roi)
+            result = _run_into(None, _add, scaled, bias, roi=roi)
+        
+        if result is None or getattr(result, 'has_error', False):
+            raise RuntimeError("affine pass failed")
         
         return result
     
@@ -63,8 +549,9 @@ class ProcessingExecutor:
         self,
         imagebuf: oiio.ImageBuf,
         filter: ProcessingFilter,
-        roi: Optional[oiio.ROI] = None
-    ) -> Optional[oiio.ImageBuf]:
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
+    ) -> oiio.ImageBuf:
         """
         Apply a single filter to image buffer.
         
@@ -72,71 +559,30 @@ class ProcessingExecutor:
             imagebuf: Input image buffer
             filter: Filter to apply
             roi: Optional region of interest
+            dst: Optional buffer with imagebuf's layout that geometry-
+                preserving filters may write into instead of allocating
         
         Returns:
-            Processed image buffer, or None if filter failed
+            Processed image buffer
+        
+        Raises:
+            ValueError: Unknown filter type or missing parameters
+            RuntimeError: The OIIO operation failed
         """
-        try:
-            # Validate filter parameters
-            is_valid, errors = filter.validate_parameters()
-            if not is_valid:
-                raise ValueError(f"Invalid filter parameters: {errors}")
-            
-            # Dispatch to appropriate handler
-            if isinstance(filter, MedianFilter):
-                return self._apply_median_filter(imagebuf, filter, roi)
-            
-            elif isinstance(filter, UnsharpMaskFilter):
-                return self._apply_unsharp_mask(imagebuf, filter, roi)
-            
-            elif isinstance(filter, ColorSpaceConversionFilter):
-                return self._apply_color_space_conversion(imagebuf, filter, roi)
-            
-            elif isinstance(filter, BrightnessContrastFilter):
-                return self._apply_brightness_contrast(imagebuf, filter, roi)
-            
-            elif isinstance(filter, GammaCorrectionFilter):
-                return self._apply_gamma_correction(imagebuf, filter, roi)
-            
-            elif isinstance(filter, FillHolesFilter):
-                return self._apply_fill_holes(imagebuf, filter, roi)
-            
-            elif isinstance(filter, FixNonFiniteFilter):
-                return self._apply_fix_non_finite(imagebuf, filter, roi)
-            
-            elif isinstance(filter, WarpTransformFilter):
-                return self._apply_warp_transform(imagebuf, filter, roi)
-            
-            elif isinstance(filter, RotateFilter):
-                return self._apply_rotate(imagebuf, filter, roi)
-            
-            elif isinstance(filter, NoiseInjectionFilter):
-                return self._apply_noise_injection(imagebuf, filter, roi)
-            
-            elif isinstance(filter, DilateFilter):
-                return self._apply_dilate(imagebuf, filter, roi)
-            
-            elif isinstance(filter, ErodeFilter):
-                return self._apply_erode(imagebuf, filter, roi)
-            
-            elif isinstance(filter, ChannelExtractFilter):
-                return self._apply_channel_extract(imagebuf, filter, roi)
-            
-            elif isinstance(filter, ChannelInvertFilter):
-                return self._apply_channel_invert(imagebuf, filter, roi)
-            
-            else:
-                raise ValueError(f"Unknown filter type: {type(filter)}")
+        handler = self._dispatch.get(type(filter))
+        if handler is None:
+            raise ValueError(f"Unknown filter type: {type(filter)}")
         
-        except Exception as e:
-            print(f"[ERROR] Failed to apply filter {filter.name}: {e}")
-            return None
+        if dst is not None and type(filter) in _DST_FILTERS:
+            return handler(imagebuf, filter, roi, dst=dst)
+        return handler(imagebuf, filter, roi)
     
     def _apply_median_filter(
         self,
         imagebuf: oiio.ImageBuf,
         filter: MedianFilter,
-        roi: Optional[oiio.ROI] = None
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
     ) -> oiio.ImageBuf:
         """Apply median filter."""
         width_param = filter.get_parameter("kernel_width")
@@ -149,7 +595,7 @@ class ProcessingExecutor:
         height = height_param.value
         
         # OIIO 2.0+ API: returns result directly
-        result = oiio.ImageBufAlgo.median_filter(imagebuf, width, height)
+        result = _run_into(dst, _median, imagebuf, width, height, roi=roi)
         
         if result is None or getattr(result, 'has_error', False):
             raise RuntimeError("median_filter failed")
@@ -160,7 +606,8 @@ class ProcessingExecutor:
         self,
         imagebuf: oiio.ImageBuf,
         filter: UnsharpMaskFilter,
-        roi: Optional[oiio.ROI] = None
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
     ) -> oiio.ImageBuf:
         """Apply unsharp mask."""
         amount_param = filter.get_parameter("amount")
@@ -175,12 +622,15 @@ class ProcessingExecutor:
         threshold = threshold_param.value if threshold_param else 0
         
         # OIIO 2.0+ API: unsharp_mask(src, kernel="gaussian", width=radius, amount=amount, threshold=threshold)
-        result = oiio.ImageBufAlgo.unsharp_mask(
+        result = _run_into(
+            dst,
+            _unsharp,
             imagebuf,
             kernel="gaussian",
             width=radius,
             amount=amount,
-            threshold=threshold
+            threshold=threshold,
+            roi=roi,
         )
         
         if result is None or getattr(result, 'has_error', False):
@@ -192,29 +642,39 @@ class ProcessingExecutor:
         self,
         imagebuf: oiio.ImageBuf,
         filter: ColorSpaceConversionFilter,
-        roi: Optional[oiio.ROI] = None
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
     ) -> oiio.ImageBuf:
         """Apply color space conversion."""
-        from_param = filter.get_parameter("from_space")
-        to_param = filter.get_parameter("to_space")
-        unpremult_param = filter.get_parameter("unpremult")
-        
-        if not all([from_param, to_param, unpremult_param]):
-            raise ValueError("Missing color space conversion parameters")
-        
-        from_space = from_param.value if from_param else None
-        to_space = to_param.value if to_param else None
-        unpremult = unpremult_param.value if unpremult_param else None
+        return self._convert_color(imagebuf, (filter,), roi, dst)
+    
+    def _convert_color(
+        self,
+        imagebuf: oiio.ImageBuf,
+        filters: tuple[ColorSpaceConversionFilter, ...],
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
+    ) -> oiio.ImageBuf:
+        """
+        Convert from the first filter's source space to the last filter's
+        destination space in a single colorconvert pass (a chain A->B, B->C
+        is planned as one step and runs as A->C).
+        """
+        from_space, _, unpremult = _color_conversion(filters[0])
+        _, to_space, _ = _color_conversion(filters[-1])
         
-        if from_space is None or to_space is None or unpremult is None:
-            raise ValueError("Color space conversion parameters have no value")
+        if from_space == to_space:
+            return imagebuf
         
         # OIIO 2.0+ API: colorconvert(src, from_space, to_space, unpremult)
-        result = oiio.ImageBufAlgo.colorconvert(
+        result = _run_into(
+            dst,
+            _colorconvert,
             imagebuf,
             from_space,
             to_space,
-            unpremult
+            unpremult,
+            roi=roi,
         )
         
         if result is None or getattr(result, 'has_error', False):
@@ -243,30 +703,14 @@ class ProcessingExecutor:
         if not all([brightness_param, contrast_param]):
             raise ValueError("Missing brightness/contrast parameters")
         
-        brightness = brightness_param.value if brightness_param else 1.0
-        contrast = contrast_param.value if contrast_param else 1.0
-        
-        # Apply contrast first (multiply), then brightness (add)
-        result = imagebuf
-        
-        # Contrast: (pixel - 0.5) * contrast + 0.5 using OIIO 2.0+ API
-        if contrast != 1.0:
-            # Subtract 0.5, multiply by contrast, add 0.5
-            temp1 = oiio.ImageBufAlgo.add(result, (-0.5, -0.5, -0.5, 0))
-            temp2 = oiio.ImageBufAlgo.mul(temp1, (contrast, contrast, contrast, 1))
-            result = oiio.ImageBufAlgo.add(temp2, (0.5, 0.5, 0.5, 0))
-        
-        # Brightness: multiply by brightness factor
-        if brightness != 1.0:
-            result = oiio.ImageBufAlgo.mul(result, (brightness, brightness, brightness, 1))
-        
-        return result
+        return self._apply_affine(imagebuf, _affine_terms(filter), roi)
     
     def _apply_gamma_correction(
         self,
         imagebuf: oiio.ImageBuf,
         filter: GammaCorrectionFilter,
-        roi: Optional[oiio.ROI] = None
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
     ) -> oiio.ImageBuf:
         """Apply gamma correction."""
         gamma_param = filter.get_parameter("gamma")
@@ -279,26 +723,57 @@ class ProcessingExecutor:
         if gamma == 1.0:
             return imagebuf
         
-        # gamma correction: pixel^(1/gamma)
-        # Use colorconvert with gamma if available, otherwise use matrix
-        result = oiio.ImageBuf()
+        # Exponent follows the parameter's contract: <1 brightens, >1 darkens
+        # (for values in [0, 1]); alpha is left untouched.
+        basetype = imagebuf.spec().format.basetype
+        if basetype in _LUT_TYPES:
+            result = self._apply_gamma_lut(imagebuf, basetype, gamma, roi, dst)
+        else:
+            result = _run_into(dst, _pow, imagebuf, _rgb(gamma, 1.0), roi=roi)
         
-        # OIIO has limited direct gamma support, so we'll use a simple approximation
-        # via colormatrixtransform or by using pixelmath
-        # For now, use identity (TODO: implement proper gamma via custom code)
-        result = imagebuf
+        if result is None or getattr(result, 'has_error', False):
+            raise RuntimeError(f"gamma correction ({gamma}) failed")
         
         return result
     
+    def _apply_gamma_lut(
+        self,
+        imagebuf: oiio.ImageBuf,
+        basetype,
+        gamma: float,
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
+    ) -> oiio.ImageBuf:
+        """Gamma for 8/16-bit buffers: one table lookup per sample, no pow."""
+        region = roi if roi is not None else oiio.ROI.All
+        pixels = imagebuf.get_pixels(imagebuf.spec().format, region)
+        
+        # Same channels as the pow path: the first three, never alpha
+        chbegin = roi.chbegin if roi is not None else 0
+        ncolor = max(0, min(3, chbegin + pixels.shape[-1]) - chbegin)
+        color = pixels[..., :ncolor]
+        color[...] = _gamma_lut(basetype, gamma)[color]
+        
+        if roi is None:
+            result = dst if dst is not None else oiio.ImageBuf(imagebuf.spec())
+        elif dst is imagebuf:
+            result = dst
+        else:
+            result = _run_into(dst, _copy, imagebuf, roi=roi)
+        if not result.set_pixels(region, pixels):
+            raise RuntimeError(result.geterror() or f"gamma correction ({gamma}) failed")
+        return result
+    
     def _apply_fill_holes(
         self,
         imagebuf: oiio.ImageBuf,
         filter: FillHolesFilter,
-        roi: Optional[oiio.ROI] = None
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
     ) -> oiio.ImageBuf:
         """Apply fill holes (push-pull) algorithm."""
         # OIIO 2.0+ API: returns result directly
-        result = oiio.ImageBufAlgo.fillholes_pushpull(imagebuf)
+        result = _run_into(dst, _fillholes, imagebuf, roi=roi)
         
         if result is None or getattr(result, 'has_error', False):
             raise RuntimeError("fillholes_pushpull failed")
@@ -309,7 +784,8 @@ class ProcessingExecutor:
         self,
         imagebuf: oiio.ImageBuf,
         filter: FixNonFiniteFilter,
-        roi: Optional[oiio.ROI] = None
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
     ) -> oiio.ImageBuf:
         """Replace NaN and Infinity values."""
         fill_param = filter.get_parameter("fill_value")
@@ -318,9 +794,37 @@ class ProcessingExecutor:
             raise ValueError("Missing fill_value parameter")
         
         fill_value = fill_param.value
+        region = roi if roi is not None else oiio.ROI.All
         
-        # OIIO 2.0+ API: returns result directly
-        result = oiio.ImageBufAlgo.fixNonFinite(imagebuf)
+        # Clean frames are the common case: a read-only native scan is
+        # cheaper than fixNonFinite's read/write/allocate pass
+        stats = _pixel_stats(imagebuf, roi=region)
+        if not any(stats.nancount) and not any(stats.infcount):
+            return imagebuf
+        
+        if fill_value == 0.0:
+            result = _run_into(
+                dst, _fix_non_finite, imagebuf, mode=oiio.NONFINITE_BLACK, roi=roi
+            )
+        else:
+            # No native "fill with constant" mode; patch the pixels directly.
+            # get_pixels already hands back a private array, so it is fixed
+            # in place and written straight to the destination.
+            pixels = imagebuf.get_pixels(oiio.FLOAT, region)
+            # One byte-per-sample mask and one masked write, instead of
+            # nan_to_num's separate NaN, +Inf and -Inf mask passes
+            bad = np.isfinite(pixels)
+            np.logical_not(bad, out=bad)
+            np.copyto(pixels, fill_value, where=bad)
+            if roi is None:
+                # Every pixel gets rewritten, so the source need not be copied first
+                result = dst if dst is not None else oiio.ImageBuf(imagebuf.spec())
+            elif dst is imagebuf:
+                result = dst
+            else:
+                result = _run_into(dst, _copy, imagebuf, roi=roi)
+            if not result.set_pixels(region, pixels):
+                raise RuntimeError(result.geterror() or "fixNonFinite failed")
         
         if result is None or getattr(result, 'has_error', False):
             raise RuntimeError("fixNonFinite failed")
@@ -342,10 +846,10 @@ class ProcessingExecutor:
         mode = mode_param.value
         
         # Default to identity matrix
-        M = (1, 0, 0, 0, 1, 0, 0, 0, 1)
+        M = _IDENTITY_M
         
         # OIIO 2.0+ API: returns result directly
-        result = oiio.ImageBufAlgo.warp(imagebuf, M)
+        result = _warp(imagebuf, M)
         
         if result is None or getattr(result, 'has_error', False):
             raise RuntimeError("warp failed")
@@ -375,8 +879,13 @@ class ProcessingExecutor:
         else:
             angle = float(angle_str)
         
-        # OIIO 2.0+ API: returns result directly
-        result = oiio.ImageBufAlgo.rotate(imagebuf, angle)
+        # Cardinal angles are an exact pixel reshuffle (no resampling);
+        # anything else goes through the filtered rotate, which takes radians
+        quarter_turn = _QUARTER_TURNS.get(angle % 360)
+        if quarter_turn is not None:
+            result = _run_into(None, quarter_turn, imagebuf)
+        else:
+            result = _rotate(imagebuf, math.radians(angle))
         
         if result is None or getattr(result, 'has_error', False):
             raise RuntimeError(f"rotate by {angle} degrees failed")
@@ -387,9 +896,10 @@ class ProcessingExecutor:
         self,
         imagebuf: oiio.ImageBuf,
         filter: NoiseInjectionFilter,
-        roi: Optional[oiio.ROI] = None
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
     ) -> oiio.ImageBuf:
-        """Inject noise into image."""
+        """Inject noise into image (color channels only; alpha is kept)."""
         noise_param = filter.get_parameter("noise_type")
         amount_param = filter.get_parameter("amount")
         
@@ -402,21 +912,47 @@ class ProcessingExecutor:
         if noise_type is None or amount is None:
             raise ValueError("Noise parameters have no value")
         
-        result = oiio.ImageBuf()
-        # Note: OIIO noise function may have different signature
-        # Using a simpler approach with add/mul for now
-        success = True  # Placeholder - would need OIIO API verification
+        # ImageBufAlgo.noise adds to the pixels already in its buffer, so
+        # start from a copy (unless already working in place)
+        result = dst if dst is imagebuf else _run_into(dst, _copy, imagebuf, roi=roi)
+        
+        spec = imagebuf.spec()
+        region = roi if roi is not None else imagebuf.roi
+        chend = region.chend
+        if spec.alpha_channel >= 0 and spec.alpha_channel == chend - 1:
+            chend -= 1
+        region = oiio.ROI(
+            region.xbegin, region.xend, region.ybegin, region.yend,
+            region.zbegin, region.zend, region.chbegin, chend,
+        )
+        
+        # The pattern is a hash of (pixel, channel, seed), so it is the same
+        # whichever roi or band a pixel is processed in
+        seed = _noise_seed(filter.filter_id)
+        if noise_type == "gaussian":
+            ok = _noise(result, "gaussian", 0.0, amount, False, seed, region)
+        elif noise_type == "uniform":
+            ok = _noise(result, "uniform", -amount, amount, False, seed, region)
+        elif noise_type == "salt_pepper":
+            # Half the affected pixels go black, half white, all channels alike
+            ok = (
+                _noise(result, "salt", 0.0, amount * 0.5, True, seed, region)
+                and _noise(result, "salt", 1.0, amount * 0.5, True, seed + 1, region)
+            )
+        else:
+            raise ValueError(f"Unknown noise type: {noise_type}")
         
-        if not success:
-            raise RuntimeError(f"noise injection ({noise_type}) failed")
+        if not ok:
+            raise RuntimeError(result.geterror() or f"noise injection ({noise_type}) failed")
         
-        return result if success else imagebuf
+        return result
     
     def _apply_dilate(
         self,
         imagebuf: oiio.ImageBuf,
         filter: DilateFilter,
-        roi: Optional[oiio.ROI] = None
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
     ) -> oiio.ImageBuf:
         """Apply dilation (morphological operation)."""
         width_param = filter.get_parameter("kernel_width")
@@ -429,7 +965,7 @@ class ProcessingExecutor:
         height = height_param.value if height_param else 0
         
         # OIIO 2.0+ API: returns result directly
-        result = oiio.ImageBufAlgo.dilate(imagebuf, width, height)
+        result = _morphology(dst, _dilate, imagebuf, width, height, roi)
         
         if result is None or getattr(result, 'has_error', False):
             raise RuntimeError("dilate failed")
@@ -440,7 +976,8 @@ class ProcessingExecutor:
         self,
         imagebuf: oiio.ImageBuf,
         filter: ErodeFilter,
-        roi: Optional[oiio.ROI] = None
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
     ) -> oiio.ImageBuf:
         """Apply erosion (morphological operation)."""
         width_param = filter.get_parameter("kernel_width")
@@ -453,7 +990,7 @@ class ProcessingExecutor:
         height = height_param.value if height_param else 0
         
         # OIIO 2.0+ API: returns result directly
-        result = oiio.ImageBufAlgo.erode(imagebuf, width, height)
+        result = _morphology(dst, _erode, imagebuf, width, height, roi)
         
         if result is None or getattr(result, 'has_error', False):
             raise RuntimeError("erode failed")
@@ -473,10 +1010,17 @@ class ProcessingExecutor:
             raise ValueError("Missing channels parameter")
         
         channels_str = channels_param.value
-        channel_list = tuple(ch.strip() for ch in channels_str.split(","))
+        channel_list = channels_param.parsed(_parse_channel_list)
+        channelnames = tuple(imagebuf.spec().channelnames)
+        indices = _channel_indices(channelnames, channel_list)
         
-        # OIIO 2.0+ API: returns result directly
-        result = oiio.ImageBufAlgo.channels(imagebuf, channel_list)
+        # Selecting every channel in its current order is a no-op
+        if indices == tuple(range(len(channelnames))):
+            return imagebuf
+        
+        # OIIO 2.0+ API: returns result directly. Unknown names are passed
+        # through as names so OIIO reports them.
+        result = _channels(imagebuf, indices if indices is not None else channel_list)
         
         if result is None or getattr(result, 'has_error', False):
             raise RuntimeError(f"channel extraction ({channels_str}) failed")
@@ -487,16 +1031,19 @@ class ProcessingExecutor:
         self,
         imagebuf: oiio.ImageBuf,
         filter: ChannelInvertFilter,
-        roi: Optional[oiio.ROI] = None
+        roi: Optional[oiio.ROI] = None,
+        dst: Optional[oiio.ImageBuf] = None,
     ) -> oiio.ImageBuf:
-        """Invert pixel values (1 - value) per channel."""
+        """Invert pixel values (1 - value) on the selected channels."""
         channels_param = filter.get_parameter("channels")
         
-        # OIIO 2.0+ API: returns result directly
-        # If channels is empty, invert all
-        result = oiio.ImageBufAlgo.invert(imagebuf)
-        
-        if result is None or getattr(result, 'has_error', False):
-            raise RuntimeError("channel invert failed")
+        if not channels_param:
+            raise ValueError("Missing channels parameter")
         
-        return result
+        # One multiply-add pass over the selected channels; unlike
+        # ImageBufAlgo.invert this leaves unselected channels (alpha) as-is
+        terms = _invert_terms(
+            tuple(imagebuf.spec().channelnames),
+            channels_param.parsed(_parse_channel_list),
+        )
+        return self._apply_affine(imagebuf, terms, roi, dst)
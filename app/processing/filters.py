@@ -5,9 +5,10 @@ Each filter represents a specific image processing operation that can be
 applied to image data via OpenImageIO's ImageBufAlgo functions.
 """
 
+from functools import lru_cache
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Optional, List, Dict
+from typing import Any, Callable, ClassVar, Optional, List, Dict, Tuple
 
 
 class ParameterType(Enum):
@@ -19,7 +20,7 @@ class ParameterType(Enum):
     BOOL = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterParameter:
     """A single parameter for a filter."""
     name: str
@@ -27,43 +28,130 @@ class FilterParameter:
     value: Any
     min_val: Optional[float] = None
     max_val: Optional[float] = None
-    options: Optional[List[str]] = None
+    options: Optional[Tuple[str, ...]] = None  # immutable; shared between clones
     description: str = ""
 
+    _validate: Callable[[Any], tuple[bool, str]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    # (value, parse(value)) from the last parsed() call
+    _parsed: Optional[tuple[Any, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.options is not None and not isinstance(self.options, tuple):
+            self.options = tuple(self.options)
+        # Resolve the type/bounds dispatch once; validate() runs per frame
+        self._validate = _make_validator(
+            self.param_type, self.name, self.min_val, self.max_val, self.options
+        )
+
     def validate(self) -> tuple[bool, str]:
         """Validate parameter value. Returns (is_valid, error_message)."""
-        
-        if self.param_type == ParameterType.FLOAT:
-            if not isinstance(self.value, (int, float)):
-                return False, f"{self.name} must be a number"
-            if self.min_val is not None and self.value < self.min_val:
-                return False, f"{self.name} must be >= {self.min_val}"
-            if self.max_val is not None and self.value > self.max_val:
-                return False, f"{self.name} must be <= {self.max_val}"
-        
-        elif self.param_type == ParameterType.INT:
-            if not isinstance(self.value, int):
-                return False, f"{self.name} must be an integer"
-            if self.min_val is not None and self.value < self.min_val:
-                return False, f"{self.name} must be >= {int(self.min_val)}"
-            if self.max_val is not None and self.value > self.max_val:
-                return False, f"{self.name} must be <= {int(self.max_val)}"
-        
-        elif self.param_type == ParameterType.CHOICE:
-            if self.options and self.value not in self.options:
-                return False, f"{self.name} must be one of: {', '.join(self.options)}"
-        
-        elif self.param_type == ParameterType.STRING:
-            if not isinstance(self.value, str):
-                return False, f"{self.name} must be a string"
-        
-        elif self.param_type == ParameterType.BOOL:
-            if not isinstance(self.value, bool):
-                return False, f"{self.name} must be a boolean"
-        
-        return True, ""
-
-
+        return self._validate(self.value)
+
+    def parsed(self, parse: Callable[[Any], Any]) -> Any:
+        """Return parse(value), cached until the value changes (one parser per parameter)."""
+        cached = self._parsed
+        if cached is None or cached[0] != self.value:
+            cached = (self.value, parse(self.value))
+            self._parsed = cached
+        return cached[1]
+
+
+_VALID = (True, "")
+
+
+def _shallow_copy(obj):
+    """Copy an instance's attributes without __init__ (cheaper than copy.copy)."""
+    cls = type(obj)
+    new = object.__new__(cls)
+    for name in getattr(cls, "__slots__", ()):
+        setattr(new, name, getattr(obj, name))
+    if hasattr(obj, "__dict__"):
+        new.__dict__.update(obj.__dict__)
+    return new
+
+
+def _bounds_check(
+    name: str,
+    min_val: Optional[float],
+    max_val: Optional[float],
+    as_int: bool,
+) -> Callable[[Any], tuple[bool, str]]:
+    """Build a min/max check for numeric parameters (bounds fixed at build time)."""
+    fmt = int if as_int else (lambda v: v)
+    low_msg = f"{name} must be >= {fmt(min_val)}" if min_val is not None else ""
+    high_msg = f"{name} must be <= {fmt(max_val)}" if max_val is not None else ""
+
+    if min_val is not None and max_val is not None:
+        def check(value):
+            if value < min_val:
+                return False, low_msg
+            if value > max_val:
+                return False, high_msg
+            return _VALID
+    elif min_val is not None:
+        def check(value):
+            return (False, low_msg) if value < min_val else _VALID
+    elif max_val is not None:
+        def check(value):
+            return (False, high_msg) if value > max_val else _VALID
+    else:
+        def check(value):
+            return _VALID
+    return check
+
+
+def _make_validator(
+    param_type: ParameterType,
+    name: str,
+    min_val: Optional[float],
+    max_val: Optional[float],
+    options: Optional[Tuple[str, ...]],
+) -> Callable[[Any], tuple[bool, str]]:
+    """Return a validator specialized for one parameter's type and constraints."""
+    if param_type == ParameterType.FLOAT:
+        bounds = _bounds_check(name, min_val, max_val, as_int=False)
+        type_msg = f"{name} must be a number"
+
+        def validate(value):
+            if not isinstance(value, (int, float)):
+                return False, type_msg
+            return bounds(value)
+        return validate
+
+    if param_type == ParameterType.INT:
+        bounds = _bounds_check(name, min_val, max_val, as_int=True)
+        type_msg = f"{name} must be an integer"
+
+        def validate(value):
+            if not isinstance(value, int):
+                return False, type_msg
+            return bounds(value)
+        return validate
+
+    if param_type == ParameterType.CHOICE:
+        if not options:
+            return lambda value: _VALID
+        choice_msg = f"{name} must be one of: {', '.join(options)}"
+        return lambda value: _VALID if value in options else (False, choice_msg)
+
+    if param_type == ParameterType.STRING:
+        type_msg = f"{name} must be a string"
+        return lambda value: _VALID if isinstance(value, str) else (False, type_msg)
+
+    if param_type == ParameterType.BOOL:
+        type_msg = f"{name} must be a boolean"
+        return lambda value: _VALID if isinstance(value, bool) else (False, type_msg)
+
+    return lambda value: _VALID
+
+
+# Not slotted: subclasses declare filter_id/category as class attributes
+# (read off the class by the registry), which would shadow the slots
 @dataclass
 class ProcessingFilter:
     """Base class for all processing filters."""
@@ -71,19 +159,51 @@ class ProcessingFilter:
     name: str
     category: str
     enabled: bool = True
-    order: int = 0
     parameters: Dict[str, FilterParameter] = field(default_factory=dict)
     hidden: bool = False  # If True, filter won't appear in UI
+    # Each output pixel depends only on the same input pixel, so the filter
+    # can run in place on any roi (and be batched with other pointwise ones)
+    is_pointwise: ClassVar[bool] = False
+    # Last validation result and the parameter values it was computed for
+    _validation_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _validation_result: Optional[tuple[bool, List[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def validate_parameters(self) -> tuple[bool, List[str]]:
         """Validate all parameters. Returns (is_valid, list_of_errors)."""
+        # Parameter values may be assigned directly (param.value = ...), so
+        # the cache is keyed on the current values rather than invalidated
+        # (compared by value: equal hashes do not imply equal values)
+        key = tuple((n, type(p.value), p.value) for n, p in self.parameters.items())
+        try:
+            hash(key)
+        except TypeError:
+            key = None  # unhashable (possibly mutable) value; always revalidate
+        
+        if key is not None and key == self._validation_key:
+            is_valid, errors = self._validation_result
+            return is_valid, list(errors)
+        
         errors = []
         for param in self.parameters.values():
             is_valid, error_msg = param.validate()
             if not is_valid:
                 errors.append(error_msg)
+        
+        self._validation_key = key
+        self._validation_result = (len(errors) == 0, tuple(errors))
         return len(errors) == 0, errors
     
+    def is_identity(self) -> bool:
+        """True if the current parameters leave every pixel unchanged."""
+        return False
+    
+    def _value(self, name: str) -> Any:
+        """Current value of a parameter, or None if it does not exist."""
+        param = self.parameters.get(name)
+        return param.value if param else None
+    
     def get_parameter(self, name: str) -> Optional[FilterParameter]:
         """Get a parameter by name."""
         return self.parameters.get(name)
@@ -93,27 +213,39 @@ class ProcessingFilter:
         if name not in self.parameters:
             return False
         self.parameters[name].value = value
+        self.parameters[name]._parsed = None
+        self._validation_key = None
         is_valid, _ = self.parameters[name].validate()
         return is_valid
     
     def clone(self) -> "ProcessingFilter":
-        """Create a deep copy of this filter with same parameters."""
-        from copy import deepcopy
-        return deepcopy(self)
+        """Create an independent copy of this filter with same parameters."""
+        # Shallow-copy the filter (subclass __init__ takes no arguments), then
+        # give it its own parameter objects. Everything a parameter holds
+        # besides its value (options, validator closure) is immutable and
+        # shared with the original.
+        new = _shallow_copy(self)
+        new.parameters = {key: _shallow_copy(p) for key, p in self.parameters.items()}
+        return new
 
 
 # ============================================================================
 # FILTER IMPLEMENTATIONS
 # ============================================================================
 
+_COLOR_SPACES = ("sRGB", "scene_linear", "ACEScg", "DCI-P3", "Rec709", "Raw")
+
 class MedianFilter(ProcessingFilter):
     """Median filter for noise reduction."""
     
+    filter_id = "median_filter"
+    category = "Filtering & Repair"
+    
     def __init__(self):
         super().__init__(
-            filter_id="median_filter",
+            filter_id=self.filter_id,
             name="Median Filter",
-            category="Filtering & Repair",
+            category=self.category,
             parameters={
                 "kernel_width": FilterParameter(
                     name="Kernel Width",
@@ -121,7 +253,7 @@ class MedianFilter(ProcessingFilter):
                     value=3,
                     min_val=1,
                     max_val=21,
-                    options=["1", "3", "5", "7", "9"],
+                    options=("1", "3", "5", "7", "9"),
                     description="Width of median kernel (must be odd)"
                 ),
                 "kernel_height": FilterParameter(
@@ -134,16 +266,22 @@ class MedianFilter(ProcessingFilter):
                 ),
             }
         )
+    
+    def is_identity(self) -> bool:
+        return self._value("kernel_width") == 1 and self._value("kernel_height") == 1
 
 
 class UnsharpMaskFilter(ProcessingFilter):
     """Unsharp mask for controlled sharpening."""
     
+    filter_id = "unsharp_mask"
+    category = "Filtering & Repair"
+    
     def __init__(self):
         super().__init__(
-            filter_id="unsharp_mask",
+            filter_id=self.filter_id,
             name="Unsharp Mask",
-            category="Filtering & Repair",
+            category=self.category,
             parameters={
                 "amount": FilterParameter(
                     name="Amount",
@@ -171,29 +309,36 @@ class UnsharpMaskFilter(ProcessingFilter):
                 ),
             }
         )
+    
+    def is_identity(self) -> bool:
+        return self._value("amount") == 0
 
 
 class ColorSpaceConversionFilter(ProcessingFilter):
     """Convert between color spaces."""
     
+    filter_id = "color_space_conversion"
+    category = "Color Transforms"
+    is_pointwise = True
+    
     def __init__(self):
         super().__init__(
-            filter_id="color_space_conversion",
+            filter_id=self.filter_id,
             name="Color Space Conversion",
-            category="Color Transforms",
+            category=self.category,
             parameters={
                 "from_space": FilterParameter(
                     name="From Color Space",
                     param_type=ParameterType.CHOICE,
                     value="sRGB",
-                    options=["sRGB", "scene_linear", "ACEScg", "DCI-P3", "Rec709", "Raw"],
+                    options=_COLOR_SPACES,
                     description="Source color space"
                 ),
                 "to_space": FilterParameter(
                     name="To Color Space",
                     param_type=ParameterType.CHOICE,
                     value="scene_linear",
-                    options=["sRGB", "scene_linear", "ACEScg", "DCI-P3", "Rec709", "Raw"],
+                    options=_COLOR_SPACES,
                     description="Destination color space"
                 ),
                 "unpremult": FilterParameter(
@@ -204,16 +349,23 @@ class ColorSpaceConversionFilter(ProcessingFilter):
                 ),
             }
         )
+    
+    def is_identity(self) -> bool:
+        return self._value("from_space") == self._value("to_space")
 
 
 class BrightnessContrastFilter(ProcessingFilter):
     """Adjust brightness and contrast."""
     
+    filter_id = "brightness_contrast"
+    category = "Tone & Dynamics"
+    is_pointwise = True
+    
     def __init__(self):
         super().__init__(
-            filter_id="brightness_contrast",
+            filter_id=self.filter_id,
             name="Brightness/Contrast",
-            category="Tone & Dynamics",
+            category=self.category,
             parameters={
                 "brightness": FilterParameter(
                     name="Brightness",
@@ -233,16 +385,23 @@ class BrightnessContrastFilter(ProcessingFilter):
                 ),
             }
         )
+    
+    def is_identity(self) -> bool:
+        return self._value("brightness") == 1 and self._value("contrast") == 1
 
 
 class GammaCorrectionFilter(ProcessingFilter):
     """Apply gamma correction."""
     
+    filter_id = "gamma_correction"
+    category = "Tone & Dynamics"
+    is_pointwise = True
+    
     def __init__(self):
         super().__init__(
-            filter_id="gamma_correction",
+            filter_id=self.filter_id,
             name="Gamma Correction",
-            category="Tone & Dynamics",
+            category=self.category,
             parameters={
                 "gamma": FilterParameter(
                     name="Gamma",
@@ -254,16 +413,22 @@ class GammaCorrectionFilter(ProcessingFilter):
                 ),
             }
         )
+    
+    def is_identity(self) -> bool:
+        return self._value("gamma") == 1
 
 
 class FillHolesFilter(ProcessingFilter):
     """Fill holes in image using push-pull algorithm."""
     
+    filter_id = "fill_holes"
+    category = "Filtering & Repair"
+    
     def __init__(self):
         super().__init__(
-            filter_id="fill_holes",
+            filter_id=self.filter_id,
             name="Fill Holes",
-            category="Filtering & Repair",
+            category=self.category,
             parameters={}  # No parameters for this filter
         )
 
@@ -271,11 +436,15 @@ class FillHolesFilter(ProcessingFilter):
 class FixNonFiniteFilter(ProcessingFilter):
     """Replace NaN and Infinity values."""
     
+    filter_id = "fix_non_finite"
+    category = "Filtering & Repair"
+    is_pointwise = True
+    
     def __init__(self):
         super().__init__(
-            filter_id="fix_non_finite",
+            filter_id=self.filter_id,
             name="Fix Non-Finite",
-            category="Filtering & Repair",
+            category=self.category,
             parameters={
                 "fill_value": FilterParameter(
                     name="Fill Value",
@@ -292,38 +461,47 @@ class FixNonFiniteFilter(ProcessingFilter):
 class WarpTransformFilter(ProcessingFilter):
     """Apply geometric warp transform using 3x3 matrix."""
     
+    filter_id = "warp_transform"
+    category = "Effects & Distortion"
+    
     def __init__(self):
         super().__init__(
-            filter_id="warp_transform",
+            filter_id=self.filter_id,
             name="Warp Transform",
-            category="Effects & Distortion",
+            category=self.category,
             parameters={
                 "matrix_mode": FilterParameter(
                     name="Matrix Mode",
                     param_type=ParameterType.CHOICE,
                     value="identity",
-                    options=["identity", "custom"],
+                    options=("identity", "custom"),
                     description="Use preset or custom 3x3 matrix"
                 ),
             },
             hidden=True  # Hidden: incomplete parameters (missing matrix values)
         )
+    
+    def is_identity(self) -> bool:
+        return self._value("matrix_mode") == "identity"
 
 
 class RotateFilter(ProcessingFilter):
     """Rotate image by specified angle."""
     
+    filter_id = "rotate"
+    category = "Effects & Distortion"
+    
     def __init__(self):
         super().__init__(
-            filter_id="rotate",
+            filter_id=self.filter_id,
             name="Rotate",
-            category="Effects & Distortion",
+            category=self.category,
             parameters={
                 "angle": FilterParameter(
                     name="Angle",
                     param_type=ParameterType.CHOICE,
                     value="0",
-                    options=["0", "90", "180", "270", "arbitrary"],
+                    options=("0", "90", "180", "270", "arbitrary"),
                     description="Rotation angle in degrees"
                 ),
                 "arbitrary_angle": FilterParameter(
@@ -336,22 +514,35 @@ class RotateFilter(ProcessingFilter):
                 ),
             }
         )
+    
+    def is_identity(self) -> bool:
+        angle = self._value("angle")
+        if angle == "arbitrary":
+            angle = self._value("arbitrary_angle")
+        try:
+            return float(angle) % 360 == 0
+        except (TypeError, ValueError):
+            return False
 
 
 class NoiseInjectionFilter(ProcessingFilter):
     """Inject noise into image."""
     
+    filter_id = "noise_injection"
+    category = "Effects & Distortion"
+    is_pointwise = True
+    
     def __init__(self):
         super().__init__(
-            filter_id="noise_injection",
+            filter_id=self.filter_id,
             name="Noise Injection",
-            category="Effects & Distortion",
+            category=self.category,
             parameters={
                 "noise_type": FilterParameter(
                     name="Noise Type",
                     param_type=ParameterType.CHOICE,
                     value="gaussian",
-                    options=["uniform", "gaussian", "salt_pepper"],
+                    options=("uniform", "gaussian", "salt_pepper"),
                     description="Type of noise to inject"
                 ),
                 "amount": FilterParameter(
@@ -364,16 +555,22 @@ class NoiseInjectionFilter(ProcessingFilter):
                 ),
             }
         )
+    
+    def is_identity(self) -> bool:
+        return self._value("amount") == 0
 
 
 class DilateFilter(ProcessingFilter):
     """Dilate image (morphological operation)."""
     
+    filter_id = "dilate"
+    category = "Morphological Operations"
+    
     def __init__(self):
         super().__init__(
-            filter_id="dilate",
+            filter_id=self.filter_id,
             name="Dilate",
-            category="Morphological Operations",
+            category=self.category,
             parameters={
                 "kernel_width": FilterParameter(
                     name="Kernel Width",
@@ -393,16 +590,22 @@ class DilateFilter(ProcessingFilter):
                 ),
             }
         )
+    
+    def is_identity(self) -> bool:
+        return self._value("kernel_width") == 1 and self._value("kernel_height") == 1
 
 
 class ErodeFilter(ProcessingFilter):
     """Erode image (morphological operation)."""
     
+    filter_id = "erode"
+    category = "Morphological Operations"
+    
     def __init__(self):
         super().__init__(
-            filter_id="erode",
+            filter_id=self.filter_id,
             name="Erode",
-            category="Morphological Operations",
+            category=self.category,
             parameters={
                 "kernel_width": FilterParameter(
                     name="Kernel Width",
@@ -422,16 +625,22 @@ class ErodeFilter(ProcessingFilter):
                 ),
             }
         )
+    
+    def is_identity(self) -> bool:
+        return self._value("kernel_width") == 1 and self._value("kernel_height") == 1
 
 
 class ChannelExtractFilter(ProcessingFilter):
     """Extract and reorder specific channels."""
     
+    filter_id = "channel_extract"
+    category = "Channel Operations"
+    
     def __init__(self):
         super().__init__(
-            filter_id="channel_extract",
+            filter_id=self.filter_id,
             name="Channel Extract",
-            category="Channel Operations",
+            category=self.category,
             parameters={
                 "channels": FilterParameter(
                     name="Channels",
@@ -447,11 +656,15 @@ class ChannelExtractFilter(ProcessingFilter):
 class ChannelInvertFilter(ProcessingFilter):
     """Invert pixel values (1 - value) per channel."""
     
+    filter_id = "channel_invert"
+    category = "Channel Operations"
+    is_pointwise = True
+    
     def __init__(self):
         super().__init__(
-            filter_id="channel_invert",
+            filter_id=self.filter_id,
             name="Channel Invert",
-            category="Channel Operations",
+            category=self.category,
             parameters={
                 "channels": FilterParameter(
                     name="Channels",
@@ -482,32 +695,39 @@ FILTER_REGISTRY = {
 }
 
 
+# One default-configured instance per filter; new filters are cloned from it
+# rather than rebuilt (and their validators re-specialized) from scratch
+_PROTOTYPES: Dict[str, ProcessingFilter] = {
+    filter_id: cls() for filter_id, cls in FILTER_REGISTRY.items()
+}
+
+
 def create_filter(filter_id: str) -> Optional[ProcessingFilter]:
     """Create a filter instance by ID. Returns None if filter not found."""
-    if filter_id not in FILTER_REGISTRY:
+    prototype = _PROTOTYPES.get(filter_id)
+    if prototype is None:
         return None
-    return FILTER_REGISTRY[filter_id]()
+    return prototype.clone()
 
 
 def get_filters_by_category(category: str) -> List[ProcessingFilter]:
     """Get all filters in a specific category."""
-    filters = []
-    for filter_class in FILTER_REGISTRY.values():
-        f = filter_class()
-        if f.category == category:
-            filters.append(f)
-    return filters
+    return [
+        _PROTOTYPES[filter_id].clone()
+        for filter_id, cls in FILTER_REGISTRY.items()
+        if cls.category == category
+    ]
 
 
 def get_all_categories() -> List[str]:
     """Get all filter categories in order."""
-    categories = []
-    seen = set()
-    for filter_class in FILTER_REGISTRY.values():
-        f = filter_class()
-        if f.category not in seen:
-            categories.append(f.category)
-            seen.add(f.category)
+    return list(_ordered_categories())
+
+
+@lru_cache(maxsize=None)
+def _ordered_categories() -> tuple[str, ...]:
+    """Registry categories in preferred order, then any others (registry is static)."""
+    categories = list(dict.fromkeys(cls.category for cls in FILTER_REGISTRY.values()))
     
     # Return in preferred order
     preferred_order = [
@@ -528,4 +748,4 @@ def get_all_categories() -> List[str]:
         if cat not in result:
             result.append(cat)
     
-    return result
+    return tuple(result)
@@ -5,30 +5,37 @@ Manages a chain of filters that are applied sequentially to image data.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from .filters import ProcessingFilter, create_filter
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingPipeline:
     """Container for a sequence of processing filters."""
     
     filters: List[ProcessingFilter] = field(default_factory=list)
     enabled: bool = True
     preview_frame: Optional[int] = None
+    # Enabled filters in order; None until rebuilt after a mutation
+    _enabled_cache: Optional[Tuple[ProcessingFilter, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Flat (validator, parameter, filter) list, and the enabled tuple it was built from
+    _validators: List[tuple] = field(default_factory=list, init=False, repr=False, compare=False)
+    _validators_for: Optional[Tuple[ProcessingFilter, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def add_filter(self, filter: ProcessingFilter) -> None:
         """Add a filter to the pipeline."""
-        filter.order = len(self.filters)
         self.filters.append(filter)
+        self._enabled_cache = None
     
     def remove_filter(self, index: int) -> bool:
         """Remove a filter by index. Returns success."""
         if 0 <= index < len(self.filters):
             del self.filters[index]
-            # Update order
-            for i, f in enumerate(self.filters):
-                f.order = i
+            self._enabled_cache = None
             return True
         return False
     
@@ -39,13 +46,17 @@ class ProcessingPipeline:
         
         filter = self.filters.pop(from_index)
         self.filters.insert(to_index, filter)
-        
-        # Update order
-        for i, f in enumerate(self.filters):
-            f.order = i
-        
+        self._enabled_cache = None
         return True
     
+    def set_filter_enabled(self, index: int, enabled: bool) -> bool:
+        """Enable or disable a filter by index. Returns success."""
+        if 0 <= index < len(self.filters):
+            self.filters[index].enabled = enabled
+            self._enabled_cache = None
+            return True
+        return False
+    
     def get_filter(self, index: int) -> Optional[ProcessingFilter]:
         """Get a filter by index."""
         if 0 <= index < len(self.filters):
@@ -62,19 +73,54 @@ class ProcessingPipeline:
                     errors.append(f"Filter {i} ({filter.name}): {error}")
         return len(errors) == 0, errors
     
+    def validate_all(self) -> tuple[bool, List[str]]:
+        """
+        Validate every enabled filter's parameters in one flat pass.
+        Returns (is_valid, errors).
+        """
+        enabled = self.get_enabled_filters()
+        if enabled is not self._validators_for:
+            self._validators = [
+                (param._validate, param, filter)
+                for filter in enabled
+                for param in filter.parameters.values()
+            ]
+            self._validators_for = enabled
+        
+        results = [validate(param.value) for validate, param, _ in self._validators]
+        if all(ok for ok, _ in results):
+            return True, []
+        
+        index = {id(f): i for i, f in enumerate(self.filters)}
+        errors = [
+            f"Filter {index[id(filter)]} ({filter.name}): {error}"
+            for (ok, error), (_, _, filter) in zip(results, self._validators)
+            if not ok
+        ]
+        return False, errors
+    
     def clear(self) -> None:
         """Remove all filters from pipeline."""
         self.filters.clear()
+        self._enabled_cache = None
     
     def is_empty(self) -> bool:
         """Check if pipeline has any filters."""
         return len(self.filters) == 0
     
-    def get_enabled_filters(self) -> List[ProcessingFilter]:
-        """Get list of enabled filters in order."""
+    def get_enabled_filters(self) -> Tuple[ProcessingFilter, ...]:
+        """
+        Get enabled filters in order.
+        
+        Cached until the pipeline is mutated through its methods; toggle
+        filters with set_filter_enabled() rather than filter.enabled.
+        """
         if not self.enabled:
-            return []
-        return [f for f in self.filters if f.enabled]
+            return ()
+        enabled = self._enabled_cache
+        if enabled is None:
+            enabled = self._enabled_cache = tuple(f for f in self.filters if f.enabled)
+        return enabled
     
     def __len__(self) -> int:
         """Return number of filters in pipeline."""
@@ -4,6 +4,14 @@ from typing import List, Tuple
 
 from ..core import SequenceSpec, ResizePolicy, ResizeAlgorithm
 
+# OIIO filter name per resize algorithm
+_ALGO_MAP = {
+    ResizeAlgorithm.LINEAR: "linear",
+    ResizeAlgorithm.CUBIC: "cubic",
+    ResizeAlgorithm.LANCZOS3: "lanczos3",
+    ResizeAlgorithm.NEAREST: "nearest",
+}
+
 
 def calculate_target_size(
     sequences: List[SequenceSpec],
@@ -30,43 +38,36 @@ def calculate_target_size(
             return spec.width, spec.height
         return 0, 0
     
-    # Collect all dimensions
-    dimensions = []
-    for seq in sequences:
-        if seq.static_probe and seq.static_probe.main_subimage:
-            spec = seq.static_probe.main_subimage.spec
-            dimensions.append((spec.width, spec.height))
+    if policy == ResizePolicy.CUSTOM:
+        return custom_width, custom_height
+    
+    # Collect all dimensions in one pass, split into width/height columns
+    dimensions = [
+        (spec.width, spec.height)
+        for spec in (
+            seq.static_probe.main_subimage.spec
+            for seq in sequences
+            if seq.static_probe and seq.static_probe.main_subimage
+        )
+    ]
     
     if not dimensions:
         return 0, 0
     
+    widths, heights = zip(*dimensions)
+    
     if policy == ResizePolicy.LARGEST:
-        widths = [d[0] for d in dimensions]
-        heights = [d[1] for d in dimensions]
         return max(widths), max(heights)
     
     elif policy == ResizePolicy.SMALLEST:
-        widths = [d[0] for d in dimensions]
-        heights = [d[1] for d in dimensions]
         return min(widths), min(heights)
     
     elif policy == ResizePolicy.AVERAGE:
-        widths = [d[0] for d in dimensions]
-        heights = [d[1] for d in dimensions]
         return int(sum(widths) / len(widths)), int(sum(heights) / len(heights))
     
-    elif policy == ResizePolicy.CUSTOM:
-        return custom_width, custom_height
-    
     return 0, 0
 
 
 def get_filter_name(algorithm: ResizeAlgorithm) -> str:
     """Map ResizeAlgorithm to OIIO filter name."""
-    algo_map = {
-        ResizeAlgorithm.LINEAR: "linear",
-        ResizeAlgorithm.CUBIC: "cubic",
-        ResizeAlgorithm.LANCZOS3: "lanczos3",
-        ResizeAlgorithm.NEAREST: "nearest",
-    }
-    return algo_map.get(algorithm, "lanczos3")
+    return _ALGO_MAP.get(algorithm, "lanczos3")
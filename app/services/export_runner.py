@@ -8,11 +8,15 @@ Supports parallel frame processing via ThreadPoolExecutor.
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
+import itertools
 import traceback
 import threading
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 
 from PySide6.QtCore import QObject, QThread, Signal, QRunnable, QThreadPool
 
@@ -20,6 +24,7 @@ import OpenImageIO as oiio
 import numpy as np
 
 from ..core import (
+    AttributeSet,
     ExportSpec,
     SequenceSpec,
     ValidationEngine,
@@ -32,6 +37,63 @@ from ..processing import ProcessingPipeline, ProcessingExecutor
 from ..processing.resize import calculate_target_size, get_filter_name
 
 
+# Frames above this many pixels are written in scanline batches so OIIO can
+# compress one batch while the previous one is being written
+_SCANLINE_WRITE_PIXELS = 16_000_000
+_SCANLINE_BATCH = 64
+
+
+# Frame number tokens in output filename patterns: %04d (printf) or #### (hash)
+_FRAME_TOKEN_RE = re.compile(r"%0(\d+)d|#+")
+
+
+@lru_cache(maxsize=8)
+def _filename_formatter(pattern: str) -> Callable[[int], str]:
+    """
+    Turn a filename pattern into a frame -> filename function.
+    
+    The pattern is split once into a str.format template (one zero-padded
+    field per frame token), so formatting a frame needs no regex.
+    """
+    template = []
+    pos = 0
+    for token in _FRAME_TOKEN_RE.finditer(pattern):
+        template.append(pattern[pos:token.start()].replace("{", "{{").replace("}", "}}"))
+        width = int(token.group(1)) if token.group(1) else len(token.group(0))
+        template.append(f"{{0:0{width}d}}")
+        pos = token.end()
+    template.append(pattern[pos:].replace("{", "{{").replace("}", "}}"))
+    return "".join(template).format
+
+
+def _source_compression(seq: SequenceSpec) -> str:
+    """Lowercase compression name of a probed sequence ('none' if unset)."""
+    compression = OiioAdapter.get_compression_from_probe(seq.static_probe, 0)
+    return compression.lower() if compression else "none"
+
+
+def _source_channel_names(seq: SequenceSpec) -> frozenset:
+    """Channel names of a probed sequence's main subimage."""
+    return frozenset(ch.name for ch in seq.static_probe.main_subimage.channels)
+
+
+def _attribute_mismatch(
+    source_attrs: AttributeSet, output_attrs: AttributeSet
+) -> Optional[str]:
+    """Reason the output attributes differ from the source's, or None if they match."""
+    if len(source_attrs.attributes) != len(output_attrs.attributes):
+        return f"Attribute count mismatch: {len(source_attrs.attributes)} vs {len(output_attrs.attributes)}"
+    
+    # get_by_name is an indexed lookup, so this is O(N + M)
+    for out_attr in output_attrs.attributes:
+        if source_attrs.get_by_name(out_attr.name) is None:
+            # Output attribute not in source (added/modified)
+            return f"Attribute '{out_attr.name}' modified or added"
+        # Note: comparing values exactly is difficult due to type conversions
+        # For now, we skip recompression only if attribute sets are identical
+    return None
+
+
 class ExportSignals(QObject):
     """Signals emitted by ExportRunner."""
     progress = Signal(int, str)  # (percent, message)
@@ -40,11 +102,16 @@ class ExportSignals(QObject):
 
 
 class AtomicProgress:
-    """Thread-safe progress counter for parallel workers."""
+    """
+    Progress counter for an export.
+    
+    Single writer: only the runner thread, which collects finished frames,
+    calls increment(); frame workers never touch it, so no lock is needed.
+    """
 
     def __init__(self, total: int):
-        self.lock = threading.Lock()
         self.completed = 0
+        self.percent = 0
         self.total = total
         self.last_logged_frame = -1
 
@@ -53,20 +120,51 @@ class AtomicProgress:
         Increment progress counter.
         Returns current percentage (0-100).
         """
-        with self.lock:
-            self.completed += 1
-            self.last_logged_frame = frame_num
-            return int((self.completed / self.total) * 100)
+        self.completed += 1
+        self.percent = self.completed * 100 // self.total
+        self.last_logged_frame = frame_num
+        return self.percent
 
     def get_percent(self) -> int:
         """Get current progress percentage."""
-        with self.lock:
-            return int((self.completed / self.total) * 100)
+        return self.percent
 
     def get_completed(self) -> int:
         """Get number of completed frames."""
+        return self.completed
+
+
+class ImageBufferPool:
+    """
+    Bounded pool of float32 frame buffers, keyed by shape.
+    
+    Frame workers hand their output buffer back once it has been written,
+    so a long export reuses a handful of allocations instead of creating
+    (and page-faulting in) a fresh multi-megabyte array per frame.
+    """
+
+    def __init__(self, max_buffers: int = 2):
+        self.lock = threading.Lock()
+        self.max_buffers = max_buffers
+        self._free: dict[tuple, deque] = {}
+
+    def acquire(self, shape: tuple) -> np.ndarray:
+        """
+        Get a buffer of the given shape.
+        Contents are uninitialized; the caller must overwrite every element.
+        """
         with self.lock:
-            return self.completed
+            free = self._free.get(shape)
+            if free:
+                return free.pop()
+        return np.empty(shape, dtype=np.float32)
+
+    def release(self, buffer: np.ndarray) -> None:
+        """Return a buffer to the pool (dropped if the pool is full)."""
+        with self.lock:
+            free = self._free.setdefault(buffer.shape, deque())
+            if len(free) < self.max_buffers:
+                free.append(buffer)
 
 
 class ExportRunner(QRunnable):
@@ -89,17 +187,32 @@ class ExportRunner(QRunnable):
         self.processing_pipeline = processing_pipeline or ProcessingPipeline()
         self.processing_executor = ProcessingExecutor()
         self.signals = ExportSignals()
-        self.stop_requested = False  # Flag to stop export
+        self._stop_event = threading.Event()  # Set to stop the export
+        self._buffer_pool = ImageBufferPool()
+        # Per-sequence source compression and channel names; probes are
+        # static for the export, so these are computed once
+        probed = {
+            seq_id: seq for seq_id, seq in sequences.items()
+            if seq.static_probe and seq.static_probe.main_subimage
+        }
+        self._seq_compression = {
+            seq_id: _source_compression(seq) for seq_id, seq in probed.items()
+        }
+        self._seq_channel_names = {
+            seq_id: _source_channel_names(seq) for seq_id, seq in probed.items()
+        }
 
     def request_stop(self) -> None:
         """Request the export to stop gracefully."""
-        self.stop_requested = True
+        self._stop_event.set()
 
     @staticmethod
     def can_skip_recompression(
         export_spec: ExportSpec,
         sequences: dict[str, SequenceSpec],
         compression_policy: str = "skip",
+        seq_compression: Optional[dict[str, str]] = None,
+        seq_channel_names: Optional[dict[str, frozenset]] = None,
     ) -> tuple[bool, str]:
         """
         Determine if recompression can be skipped.
@@ -108,29 +221,34 @@ class ExportRunner(QRunnable):
             export_spec: Export specification
             sequences: Available sequences
             compression_policy: 'skip' (default) to skip when possible, 'always' to never skip
+            seq_compression: Precomputed source compression per sequence id
+            seq_channel_names: Precomputed source channel names per sequence id
         
         Returns (can_skip, reason_explanation).
-        Recompression can be skipped when:
+        Recompression can be skipped when (cheapest checks first):
         1. Compression policy allows it ('skip' mode)
-        2. All output channels come from SAME source sequence
-        3. Output includes ALL channels from source (no subset)
-        4. Source and target compression match
-        5. No attribute modifications from source
-        6. No channel format overrides
+        2. No channel format overrides
+        3. All output channels come from SAME source sequence
+        4. Output includes ALL channels from source (no subset)
+        5. Source and target compression match
+        6. No attribute modifications from source
         """
-        # Check 0: Compression policy
+        # Check 1: Compression policy
         if compression_policy == "always":
             return False, "Compression policy: always recompress"
         
-        # Check 1: Single source sequence
-        source_seq_ids = set(
-            ch.source.sequence_id 
-            for ch in export_spec.output_channels
-        )
+        output_channels = export_spec.output_channels
+        
+        # Check 2: No format overrides
+        if any(ch.override_format for ch in output_channels):
+            return False, "Output channel format override present"
+        
+        # Check 3: Single source sequence
+        source_seq_ids = {ch.source.sequence_id for ch in output_channels}
         if len(source_seq_ids) != 1:
             return False, f"Multiple source sequences ({len(source_seq_ids)})"
         
-        seq_id = list(source_seq_ids)[0]
+        seq_id = next(iter(source_seq_ids))
         source_seq = sequences.get(seq_id)
         if not source_seq or not source_seq.static_probe:
             return False, f"Source sequence '{seq_id}' not found or not probed"
@@ -139,51 +257,109 @@ class ExportRunner(QRunnable):
         if not source_subimage:
             return False, "Source file has no main subimage"
         
-        # Check 2: Output includes ALL source channels
-        source_channel_names = set(ch.name for ch in source_subimage.channels)
-        output_channel_names = set(
-            ch.source.channel_name 
-            for ch in export_spec.output_channels
-        )
+        # Check 4: Output includes ALL source channels
+        if seq_channel_names and seq_id in seq_channel_names:
+            source_channel_names = seq_channel_names[seq_id]
+        else:
+            source_channel_names = _source_channel_names(source_seq)
+        output_channel_names = frozenset(ch.source.channel_name for ch in output_channels)
         
         if source_channel_names != output_channel_names:
             return False, "Output is subset/superset of source channels"
         
-        # Check 3: Compression matches
-        source_compression = OiioAdapter.get_compression_from_probe(
-            source_seq.static_probe, 0
-        )
-        
-        # Normalize compression names (handle case variations)
-        source_comp_normalized = source_compression.lower() if source_compression else "none"
+        # Check 5: Compression matches (names normalized to lowercase)
+        if seq_compression and seq_id in seq_compression:
+            source_comp_normalized = seq_compression[seq_id]
+        else:
+            source_comp_normalized = _source_compression(source_seq)
         target_comp_normalized = export_spec.compression.lower()
         
         if source_comp_normalized != target_comp_normalized:
             return False, f"Compression mismatch: {source_comp_normalized} vs {target_comp_normalized}"
         
-        # Check 4: No attribute modifications
-        source_attrs = source_subimage.attributes
-        output_attrs = export_spec.output_attributes
+        # Check 6: No attribute modifications
+        mismatch = _attribute_mismatch(source_subimage.attributes, export_spec.output_attributes)
+        if mismatch:
+            return False, mismatch
         
-        # Compare attribute count and values
-        if len(source_attrs.attributes) != len(output_attrs.attributes):
-            return False, f"Attribute count mismatch: {len(source_attrs.attributes)} vs {len(output_attrs.attributes)}"
+        return True, "Can skip recompression: identical copy possible"
+
+    @staticmethod
+    def can_copy_native_subset(
+        export_spec: ExportSpec,
+        sequences: dict[str, SequenceSpec],
+        compression_policy: str = "skip",
+        seq_compression: Optional[dict[str, str]] = None,
+    ) -> tuple[Optional[tuple[int, int, str]], str]:
+        """
+        Determine if the output is a channel range of one source that can be
+        copied in the source's native pixel type.
+        
+        Returns ((chbegin, chend, format), reason) when possible, where format
+        is the range's OIIO type string, else (None, reason).
+        This applies when:
+        1. Compression policy allows it ('skip' mode)
+        2. No channel format overrides and no resize
+        3. All output channels come from the main subimage of ONE source sequence
+        4. They are a contiguous range of its channels, in order, unrenamed
+        5. That range has a single channel format
+        6. Source and target compression match
+        7. No attribute modifications from source
+        """
+        if compression_policy == "always":
+            return None, "Compression policy: always recompress"
         
-        # Check each attribute matches
-        for out_attr in output_attrs.attributes:
-            src_attr = source_attrs.get_by_name(out_attr.name)
-            if not src_attr:
-                # Output attribute not in source (added/modified)
-                return False, f"Attribute '{out_attr.name}' modified or added"
-            # Note: comparing values exactly is difficult due to type conversions
-            # For now, we skip recompression only if attribute sets are identical
+        output_channels = export_spec.output_channels
+        if not output_channels:
+            return None, "No output channels"
+        if any(ch.override_format for ch in output_channels):
+            return None, "Output channel format override present"
+        if export_spec.resize_spec.policy != ResizePolicy.NONE:
+            return None, "Resize enabled"
         
-        # Check 5: No format overrides
-        for ch in export_spec.output_channels:
-            if ch.override_format:
-                return False, "Output channel format override present"
+        seq_id = output_channels[0].source.sequence_id
+        if any(ch.source.sequence_id != seq_id or ch.source.subimage_index != 0
+               for ch in output_channels):
+            return None, "Channels from several sequences or subimages"
         
-        return True, "Can skip recompression: identical copy possible"
+        source_seq = sequences.get(seq_id)
+        if not source_seq or not source_seq.static_probe or not source_seq.static_probe.main_subimage:
+            return None, f"Source sequence '{seq_id}' not found or not probed"
+        source_subimage = source_seq.static_probe.main_subimage
+        
+        # Output must be source channels [chbegin, chend) in order, keeping their names
+        source_names = [ch.name for ch in source_subimage.channels]
+        first = output_channels[0].source.channel_name
+        if first not in source_names:
+            return None, f"Channel '{first}' not in source"
+        chbegin = source_names.index(first)
+        chend = chbegin + len(output_channels)
+        if [ch.source.channel_name for ch in output_channels] != source_names[chbegin:chend]:
+            return None, "Output channels are not a contiguous range of the source"
+        if any(ch.output_name != ch.source.channel_name for ch in output_channels):
+            return None, "Output channels are renamed"
+        
+        formats = {ch.format.oiio_type for ch in source_subimage.channels[chbegin:chend]}
+        if len(formats) != 1:
+            return None, "Mixed channel formats in range"
+        
+        if seq_compression and seq_id in seq_compression:
+            source_comp_normalized = seq_compression[seq_id]
+        else:
+            source_comp_normalized = _source_compression(source_seq)
+        target_comp_normalized = export_spec.compression.lower()
+        if source_comp_normalized != target_comp_normalized:
+            return None, f"Compression mismatch: {source_comp_normalized} vs {target_comp_normalized}"
+        
+        mismatch = _attribute_mismatch(source_subimage.attributes, export_spec.output_attributes)
+        if mismatch:
+            return None, mismatch
+        
+        (channel_format,) = formats
+        return (
+            (chbegin, chend, channel_format),
+            f"Native copy of channels {chbegin}-{chend - 1} ({channel_format}) possible",
+        )
 
     def run(self) -> None:
         """Execute the export with parallel frame processing."""
@@ -208,11 +384,9 @@ class ExportRunner(QRunnable):
             self._log(f"Number of input sequences: {len(self.sequences)}")
             
             # Log compression for each sequence
-            for seq_id, seq in self.sequences.items():
-                if seq.static_probe and seq.static_probe.main_subimage:
-                    src_compression = OiioAdapter.get_compression_from_probe(seq.static_probe, 0)
-                    src_compression = src_compression.lower() if src_compression else "none"
-                    self._log(f"  - {seq.display_name}: {len(seq.frames)} frames, compression: {src_compression}")
+            for seq_id, src_compression in self._seq_compression.items():
+                seq = self.sequences[seq_id]
+                self._log(f"  - {seq.display_name}: {len(seq.frames)} frames, compression: {src_compression}")
 
             # Validation
             self._log("\nValidating export configuration...")
@@ -258,25 +432,45 @@ class ExportRunner(QRunnable):
             can_skip, reason = self.can_skip_recompression(
                 self.export_spec, 
                 self.sequences,
-                self.compression_policy
+                self.compression_policy,
+                self._seq_compression,
+                self._seq_channel_names,
             )
             if can_skip:
                 self._log(f"✓ OPTIMIZATION ENABLED: {reason}")
                 self._log("  Using direct copy (no decompression/recompression)")
                 self._export_frames_direct_copy(frame_list)
             else:
-                self._log(f"Standard export: {reason}")
-                self._export_frames_parallel(frame_list)
+                native_subset, subset_reason = self.can_copy_native_subset(
+                    self.export_spec,
+                    self.sequences,
+                    self.compression_policy,
+                    self._seq_compression,
+                )
+                pipeline_active = (
+                    self.processing_pipeline.enabled and not self.processing_pipeline.is_empty()
+                )
+                if native_subset and not pipeline_active:
+                    self._log(f"✓ OPTIMIZATION ENABLED: {subset_reason}")
+                    self._log("  Using native channel-subset copy (no float conversion)")
+                    self._export_frames_direct_copy(frame_list, native_subset)
+                else:
+                    self._log(f"Standard export: {reason}")
+                    self._export_frames_parallel(frame_list)
 
         except Exception as e:
             self._log(f"FATAL: {e}")
             traceback.print_exc()
             self.signals.finished.emit(False, f"Export failed: {e}")
 
-    def _export_frames_direct_copy(self, frame_list: List[int]) -> None:
+    def _export_frames_direct_copy(
+        self, frame_list: List[int], native_subset: Optional[tuple[int, int, str]] = None
+    ) -> None:
         """
         Export frames via direct copy without decompression/recompression.
-        Only used when compression matches and channels unchanged.
+        Only used when compression matches and channels unchanged, or, with
+        native_subset (chbegin, chend, format), when the output is a
+        native-type channel range of the source (see can_copy_native_subset).
         Falls back to standard export if copy fails.
         """
         progress = AtomicProgress(len(frame_list))
@@ -300,13 +494,16 @@ class ExportRunner(QRunnable):
 
         try:
             for frame_num in frame_list:
-                if self.stop_requested:
+                if self._stop_event.is_set():
                     self._log("Export stopped by user")
                     self.signals.finished.emit(False, "Export stopped by user")
                     return
 
                 try:
-                    self._export_frame_direct_copy(frame_num, source_seq)
+                    if native_subset is None:
+                        self._export_frame_direct_copy(frame_num, source_seq)
+                    else:
+                        self._export_frame_native_subset(frame_num, source_seq, *native_subset)
                     percent = progress.increment(frame_num)
                     self.signals.progress.emit(percent, f"Frame {frame_num} (direct copy)")
                 except Exception as e:
@@ -394,11 +591,89 @@ class ExportRunner(QRunnable):
                 pass
             raise
 
+    def _export_frame_native_subset(
+        self,
+        frame_num: int,
+        source_seq: SequenceSpec,
+        chbegin: int,
+        chend: int,
+        channel_format: str,
+    ) -> None:
+        """
+        Copy channels [chbegin, chend) of a frame in their pixel type,
+        channel_format (the range's single OIIO type).
+        
+        The pixels are decoded and re-encoded, but never converted to float,
+        so half data moves at half the bandwidth and skips the float buffers.
+        The type is requested explicitly: the file may mix per-channel
+        formats (e.g. half RGBA + float Z), and then a native read does not
+        return the range's own type.
+        Raises exception on failure (caller handles fallback).
+        """
+        actual_frame = self._get_frame_for_sequence(frame_num, source_seq)
+        source_path = source_seq.source_dir / source_seq.pattern.format(actual_frame)
+        if not source_path.exists():
+            raise RuntimeError(f"Source file not found: {source_path}")
+
+        output_path = Path(self.export_spec.output_dir) / self._format_filename(
+            self.export_spec.filename_pattern, frame_num
+        )
+
+        inp = oiio.ImageInput.open(str(source_path))
+        if not inp:
+            raise RuntimeError(f"Cannot open source: {source_path}")
+        out = None
+        try:
+            src_spec = inp.spec()
+            pixel_type = oiio.TypeDesc(channel_format)
+            pixels = inp.read_image(0, 0, chbegin, chend, pixel_type)
+            if pixels is None:
+                raise RuntimeError(f"Failed to read channels from {source_path}")
+
+            # Source spec, narrowed to the copied channels
+            out_spec = oiio.ImageSpec(src_spec)
+            out_spec.nchannels = chend - chbegin
+            out_spec.channelnames = tuple(src_spec.channelnames)[chbegin:chend]
+            # One format for every copied channel (also clears per-channel formats)
+            out_spec.set_format(pixel_type)
+            out_spec.alpha_channel = (
+                src_spec.alpha_channel - chbegin
+                if chbegin <= src_spec.alpha_channel < chend else -1
+            )
+            out_spec.z_channel = (
+                src_spec.z_channel - chbegin
+                if chbegin <= src_spec.z_channel < chend else -1
+            )
+
+            out = oiio.ImageOutput.create(str(output_path))
+            if not out:
+                raise RuntimeError(f"Cannot create output: {output_path}")
+            if not out.open(str(output_path), out_spec):
+                raise RuntimeError(f"Cannot open output for writing: {output_path}")
+            if not out.write_image(pixels):
+                raise RuntimeError(f"Failed to write image data: {out.geterror()}")
+            self._log(f"Wrote (native channel copy): {output_path}")
+        finally:
+            inp.close()
+            if out:
+                out.close()
+
     def _export_frames_parallel(self, frame_list: List[int]) -> None:
         """Export frames in parallel using ThreadPoolExecutor."""
         num_workers = self._get_optimal_worker_count(len(frame_list))
         available_cores = os.cpu_count() or 4
         progress = AtomicProgress(len(frame_list))
+        # One output buffer per worker, plus one being handed back
+        self._buffer_pool = ImageBufferPool(max_buffers=num_workers + 1)
+        # Split the cores between frame workers and OIIO's own decode/encode
+        # threads; restored once the export finishes
+        codec_threads = max(1, available_cores // num_workers)
+        previous_threads = (
+            oiio.get_int_attribute("threads", 0),
+            oiio.get_int_attribute("exr_threads", 0),
+        )
+        oiio.attribute("threads", codec_threads)
+        oiio.attribute("exr_threads", codec_threads)
 
         self._log("\n" + "-"*60)
         self._log("PARALLEL EXPORT MODE (Standard Processing)")
@@ -406,11 +681,8 @@ class ExportRunner(QRunnable):
         self._log(f"Total frames to export: {len(frame_list)}")
         self._log(f"Available CPU cores: {available_cores}")
         self._log(f"Frame-level worker threads: {num_workers}")
-        self._log(f"Channel-level parallelization: ADAPTIVE (memory-aware)")
-        self._log(f"  - Small frames (<5MP): up to 4 parallel channels")
-        self._log(f"  - Medium frames (5-10MP): up to 3 parallel channels")
-        self._log(f"  - Large frames (10-25MP): up to 2 parallel channels")
-        self._log(f"  - Very large frames (>25MP): sequential channel reading")
+        self._log(f"OIIO codec threads per frame: {codec_threads}")
+        self._log(f"Channel reads: one decode per source file/subimage per frame")
         self._log(f"Compression: {self.export_spec.compression}")
         self._log(f"Output channels: {len(self.export_spec.output_channels)}")
         self._log(f"Processing mode: {'Decompression + Recompression' if num_workers > 1 else 'Single-threaded'}")
@@ -418,44 +690,55 @@ class ExportRunner(QRunnable):
 
         try:
             with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                # Submit all frame export tasks
-                futures = {
-                    executor.submit(self._export_frame_wrapper, frame_num): frame_num
-                    for frame_num in frame_list
-                }
-
-                # Process completions as they arrive, checking stop_requested regularly
-                for future in as_completed(futures):
-                    if self.stop_requested:
-                        # Immediately terminate all workers
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        self._log("Export stopped by user - terminating all workers")
-                        self.signals.finished.emit(False, "Export stopped by user")
-                        return
-
-                    frame_num = futures[future]
-                    try:
-                        # Skip if future was cancelled
-                        if future.cancelled():
-                            continue
-
-                        future.result()  # Will raise if exception occurred
-                        percent = progress.increment(frame_num)
-                        self.signals.progress.emit(percent, f"Frame {frame_num} (worker pool)")
-
-                    except Exception as e:
-                        # Check if error was due to user stop request
-                        if self.stop_requested:
+                # Keep at most 2 * num_workers frames in flight, so pending work
+                # (and the buffers it holds) stays bounded however long the
+                # sequence is
+                frames = iter(frame_list)
+                futures = {}
+
+                def submit(count: int) -> None:
+                    for frame_num in itertools.islice(frames, count):
+                        futures[executor.submit(self._export_frame_wrapper, frame_num)] = frame_num
+
+                submit(2 * num_workers)
+
+                # Process completions as they arrive, checking for a stop request
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        frame_num = futures.pop(future)
+                        if self._stop_event.is_set():
+                            # Immediately terminate all workers
                             executor.shutdown(wait=False, cancel_futures=True)
-                            self._log("Export stopped by user")
+                            self._log("Export stopped by user - terminating all workers")
                             self.signals.finished.emit(False, "Export stopped by user")
                             return
+
+                        try:
+                            # Skip if future was cancelled
+                            if future.cancelled():
+                                continue
+
+                            future.result()  # Will raise if exception occurred
+                            percent = progress.increment(frame_num)
+                            self.signals.progress.emit(percent, f"Frame {frame_num} (worker pool)")
+
+                        except Exception as e:
+                            # Check if error was due to user stop request
+                            if self._stop_event.is_set():
+                                executor.shutdown(wait=False, cancel_futures=True)
+                                self._log("Export stopped by user")
+                                self.signals.finished.emit(False, "Export stopped by user")
+                                return
                         
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        self._log(f"ERROR exporting frame {frame_num}: {e}")
-                        traceback.print_exc()
-                        self.signals.finished.emit(False, f"Export failed at frame {frame_num}")
-                        return
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            self._log(f"ERROR exporting frame {frame_num}: {e}")
+                            traceback.print_exc()
+                            self.signals.finished.emit(False, f"Export failed at frame {frame_num}")
+                            return
+
+                    # Refill the window for the frames that just finished
+                    submit(len(done))
 
             # All frames completed successfully
             self._log("-"*60)
@@ -471,13 +754,18 @@ class ExportRunner(QRunnable):
             traceback.print_exc()
             self.signals.finished.emit(False, f"Export failed: {e}")
 
+        finally:
+            oiio.attribute("threads", previous_threads[0])
+            oiio.attribute("exr_threads", previous_threads[1])
+
     def _export_frame_wrapper(self, frame_num: int) -> None:
         """
         Wrapper for frame export that can be used with ThreadPoolExecutor.
-        Checks stop_requested flag and provides graceful cancellation.
+        Checks the stop event once up front and provides graceful cancellation;
+        frame export itself only re-checks it before writing.
         """
         # Check if stop was requested before starting
-        if self.stop_requested:
+        if self._stop_event.is_set():
             return
 
         # Export the frame, checking stop flag during processing
@@ -485,7 +773,7 @@ class ExportRunner(QRunnable):
             self._export_frame(frame_num)
         except Exception:
             # If stop was requested during export, suppress the exception
-            if self.stop_requested:
+            if self._stop_event.is_set():
                 return
             raise
 
@@ -496,7 +784,9 @@ class ExportRunner(QRunnable):
         Strategy:
         - For small exports (<5 frames): 1 worker
         - For medium exports (5-100): min(4, available_cores)
-        - For large exports (>100): min(8, available_cores)
+        - For large exports (>100): min(4, available_cores // 4); the
+          remaining cores go to OIIO's per-frame codec threads rather than
+          more concurrent frames (and their buffers)
         """
         available_cores = os.cpu_count() or 4
 
@@ -505,7 +795,7 @@ class ExportRunner(QRunnable):
         elif num_frames < 100:
             return min(4, available_cores)
         else:
-            return min(8, available_cores)
+            return max(1, min(4, available_cores // 4))
 
     def _resolve_frame_list(self) -> List[int]:
         """
@@ -567,10 +857,6 @@ class ExportRunner(QRunnable):
 
     def _export_frame(self, frame_num: int) -> None:
         """Export a single frame with detailed compression and channel info."""
-        # Check if stop was requested
-        if self.stop_requested:
-            raise RuntimeError("Export stopped by user")
-
         # Build output filename
         pattern = self.export_spec.filename_pattern
         output_path = Path(self.export_spec.output_dir) / self._format_filename(
@@ -583,26 +869,25 @@ class ExportRunner(QRunnable):
             raise RuntimeError(f"Failed to assemble frame {frame_num}")
 
         # Check again before writing (I/O operations may have taken time)
-        if self.stop_requested:
+        if self._stop_event.is_set():
             raise RuntimeError("Export stopped by user")
 
-        # Write output EXR
-        self._write_exr(output_path, output_data, output_spec)
+        # Write output EXR, then hand the frame buffer back for the next frame
+        try:
+            self._write_exr(output_path, output_data, output_spec)
+        finally:
+            self._buffer_pool.release(output_data)
         
         # Log detailed information about written frame
         channel_names = ", ".join(output_spec.get("channels", []))
         resolution = f"{output_spec.get('width', '?')}x{output_spec.get('height', '?')}"
         num_channels = len(output_spec.get('channels', []))
-        self._log(f"  Frame {frame_num}: {resolution} | {num_channels} channels (parallel read: {channel_names}) | compression: {self.export_spec.compression}")
+        self._log(f"  Frame {frame_num}: {resolution} | {num_channels} channels ({channel_names}) | compression: {self.export_spec.compression}")
 
 
     def _format_filename(self, pattern: str, frame: int) -> str:
         """Format filename with frame number."""
-        import re
-        result = pattern
-        result = re.sub(r"%0(\d+)d", lambda m: str(frame).zfill(int(m.group(1))), result)
-        result = re.sub(r"#+", lambda m: str(frame).zfill(len(m.group(0))), result)
-        return result
+        return _filename_formatter(pattern)(frame)
 
     def _get_frame_for_sequence(self, requested_frame_index: int, sequence: SequenceSpec) -> int:
         """
@@ -652,8 +937,8 @@ class ExportRunner(QRunnable):
         """
         Assemble output frame from selected input channels.
         
-        Optimized to read channels in parallel from same source files.
-        Channels from different files are grouped and read in parallel batches.
+        Channels are grouped by source file and subimage; each group is
+        decoded once and copied straight into the output buffer.
         Applies resize if configured.
 
         Returns (pixel_data, spec_dict) or (None, {}) if failed.
@@ -686,16 +971,15 @@ class ExportRunner(QRunnable):
                 self._log(f"[RESIZE] Resizing from {width}x{height} to {target_w}x{target_h} ({resize_spec.algorithm.name})")
                 width, height = target_w, target_h
 
-        # Allocate output buffer (float32 for now; could be more flexible)
+        # Output buffer (float32 for now; could be more flexible). Pooled and
+        # uninitialized: channels that are not read are zeroed after the reads.
         n_output_channels = len(self.export_spec.output_channels)
-        output_data = np.zeros((height, width, n_output_channels), dtype=np.float32)
+        output_data = self._buffer_pool.acquire((height, width, n_output_channels))
+        filled = [False] * n_output_channels
 
-        # Check for stop request before starting channel reads
-        if self.stop_requested:
-            raise RuntimeError("Export stopped by user")
-
-        # Group channels by source file for efficient parallel reading
-        channels_by_source = {}  # (sequence_id, frame_path) -> [(out_idx, channel_spec), ...]
+        # Group channels by source file, then subimage, so each file is opened
+        # once and each subimage decoded once
+        channels_by_source = {}  # frame_path -> {subimage_index: [(out_idx, channel_spec), ...]}
         
         for out_idx, out_ch in enumerate(self.export_spec.output_channels):
             src_seq = self.sequences.get(out_ch.source.sequence_id)
@@ -712,43 +996,28 @@ class ExportRunner(QRunnable):
                 self._log(f"Warning: Source file not found: {frame_path}")
                 continue
 
-            key = (out_ch.source.sequence_id, str(frame_path))
-            if key not in channels_by_source:
-                channels_by_source[key] = []
-            channels_by_source[key].append((out_idx, out_ch))
-
-        # Read channels in parallel batches (channels from same file in parallel)
-        # For each source file, use ThreadPoolExecutor to read all channels from that file in parallel
-        for source_key, channel_list in channels_by_source.items():
-            if self.stop_requested:
-                raise RuntimeError("Export stopped by user")
+            subimages = channels_by_source.setdefault(str(frame_path), {})
+            subimages.setdefault(out_ch.source.subimage_index, []).append((out_idx, out_ch))
 
-            seq_id, frame_path = source_key
-            
-            # Read all channels from this file in parallel (with memory-aware limits)
+        # Read each file's channels straight into their output slices
+        for frame_path, channels_by_subimage in channels_by_source.items():
             try:
-                results = self._read_channels_parallel_from_file(
-                    frame_path,
-                    channel_list,
-                    frame_resolution=(width, height)
-                )
-                
-                # Populate output buffer with results
-                for (out_idx, out_ch), src_data in zip(channel_list, results):
-                    if src_data is not None:
-                        self._log(f"[ASSEMBLE] Channel {out_idx} ({out_ch.output_name}): "
-                                 f"src_data shape={src_data.shape}, dtype={src_data.dtype}, "
-                                 f"min={src_data.min():.6f}, max={src_data.max():.6f}")
-                        output_data[:, :, out_idx] = src_data
-                    else:
-                        self._log(f"[ASSEMBLE] Channel {out_idx} ({out_ch.output_name}): NO DATA")
-                    
+                for out_idx in self._read_channels_into(
+                    frame_path, channels_by_subimage, output_data
+                ):
+                    filled[out_idx] = True
             except Exception as e:
-                # Suppress exception if stop was requested
-                if self.stop_requested:
-                    raise RuntimeError("Export stopped by user")
                 self._log(f"Warning: Could not read channels from {frame_path}: {e}")
 
+        for out_idx, was_filled in enumerate(filled):
+            if was_filled:
+                src_data = output_data[:, :, out_idx]
+                self._log(f"[ASSEMBLE] Channel {out_idx} ({self.export_spec.output_channels[out_idx].output_name}): "
+                         f"min={src_data.min():.6f}, max={src_data.max():.6f}")
+            else:
+                self._log(f"[ASSEMBLE] Channel {out_idx} ({self.export_spec.output_channels[out_idx].output_name}): NO DATA")
+                output_data[:, :, out_idx] = 0.0
+
         self._log(f"[ASSEMBLE] Final output_data shape={output_data.shape}, dtype={output_data.dtype}, "
                  f"min={output_data.min():.6f}, max={output_data.max():.6f}, "
                  f"non-zero pixels={np.count_nonzero(output_data)}")
@@ -759,293 +1028,85 @@ class ExportRunner(QRunnable):
             "channels": [ch.output_name for ch in self.export_spec.output_channels],
         }
 
-    def _read_channels_parallel_from_file(
-        self, filepath: str, channel_specs: List[tuple[int, any]], frame_resolution: tuple[int, int] = None
-    ) -> List[Optional[np.ndarray]]:
+    def _read_channels_into(
+        self,
+        filepath: str,
+        channels_by_subimage: dict[int, List[tuple[int, any]]],
+        output_data: np.ndarray,
+    ) -> List[int]:
         """
-        Read multiple channels from the same file with memory-aware parallelization.
+        Read the requested channels of one file into their output slices.
         
-        For large frames, automatically falls back to sequential reading to avoid
-        memory exhaustion from simultaneous large buffer allocations.
+        The file is opened once. For each subimage, the smallest channel range
+        covering its requested channels is decoded once as float, resized once
+        if configured and the size differs from the output, then each channel
+        is copied into output_data[:, :, out_idx].
         
         Args:
             filepath: Path to source file
-            channel_specs: List of (out_idx, channel_spec) tuples
-            frame_resolution: (width, height) tuple for memory estimation
+            channels_by_subimage: subimage index -> list of (out_idx, channel_spec)
+            output_data: (height, width, n_output_channels) float32 frame buffer
         
         Returns:
-            List of numpy arrays in same order as channel_specs, or None for each failed read
+            Output indices that were filled (channels missing from the file are skipped)
         """
-        if not channel_specs:
+        inp = oiio.ImageInput.open(filepath)
+        if not inp:
             return []
 
-        results = [None] * len(channel_specs)
-        
-        # If only one channel, read directly without threading overhead
-        if len(channel_specs) == 1:
-            out_idx, out_ch = channel_specs[0]
-            try:
-                data = self._read_channel_from_file(
-                    filepath,
-                    out_ch.source.channel_name,
-                    out_ch.source.subimage_index,
-                )
-                results[0] = data
-            except Exception:
-                pass
-            return results
-
-        # Estimate memory usage per parallel read
-        # Each channel read = width × height × 4 bytes (float32)
-        num_workers = self._calculate_optimal_channel_workers(len(channel_specs), frame_resolution)
-        
-        if num_workers <= 1:
-            # Sequential reading for large frames
-            for idx, (out_idx, out_ch) in enumerate(channel_specs):
-                try:
-                    results[idx] = self._read_channel_from_file(
-                        filepath,
-                        out_ch.source.channel_name,
-                        out_ch.source.subimage_index,
-                    )
-                except Exception as e:
-                    if not self.stop_requested:
-                        pass  # Silently handle, will be logged elsewhere
-        else:
-            # Use ThreadPoolExecutor for parallel channel reads from same file
-            try:
-                with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                    futures = []
-                    
-                    for idx, (out_idx, out_ch) in enumerate(channel_specs):
-                        future = executor.submit(
-                            self._read_channel_from_file,
-                            filepath,
-                            out_ch.source.channel_name,
-                            out_ch.source.subimage_index,
-                        )
-                        futures.append((idx, future))
-                    
-                    # Collect results
-                    for idx, future in futures:
-                        try:
-                            results[idx] = future.result()
-                        except Exception as e:
-                            if not self.stop_requested:
-                                pass  # Silently handle
-            
-            except Exception as e:
-                # Fall back to sequential reading on any error
-                for idx, (out_idx, out_ch) in enumerate(channel_specs):
-                    try:
-                        results[idx] = self._read_channel_from_file(
-                            filepath,
-                            out_ch.source.channel_name,
-                            out_ch.source.subimage_index,
-                        )
-                    except Exception:
-                        pass
-
-        return results
-
-    def _calculate_optimal_channel_workers(self, num_channels: int, frame_resolution: tuple[int, int] = None) -> int:
-        """
-        Calculate optimal number of parallel channel readers based on memory constraints.
-        
-        For large frames, reduces parallelism to avoid memory exhaustion.
-        
-        Args:
-            num_channels: Number of channels to read
-            frame_resolution: (width, height) tuple or None
-        
-        Returns:
-            Number of worker threads (1 = sequential)
-        """
-        # Default resolution if not provided
-        if frame_resolution is None:
-            width, height = 2048, 1080
-        else:
-            width, height = frame_resolution
-        
-        # Estimate bytes per channel: width × height × 4 (float32)
-        bytes_per_channel = width * height * 4
-        
-        # Memory thresholds
-        # Large frame = > 10 million pixels (40+ MB per channel)
-        # Very large frame = > 25 million pixels (100+ MB per channel)
-        pixels = width * height
-        
-        if pixels > 25_000_000:
-            # Very large frames (> 100MB per channel) - sequential only
-            return 1
-        elif pixels > 10_000_000:
-            # Large frames (40-100MB per channel) - max 2 parallel
-            return min(2, num_channels)
-        elif pixels > 5_000_000:
-            # Medium frames (20-40MB per channel) - max 3 parallel
-            return min(3, num_channels)
-        else:
-            # Small frames - up to 4 parallel (original behavior)
-            return min(4, num_channels)
-
-    def _read_channel_from_file(
-        self, filepath: str, channel_name: str, subimage_index: int = 0
-    ) -> Optional[np.ndarray]:
-        """
-        Read a single channel from a file (thread-safe).
-        Applies resize if configured.
-        
-        This method is designed to be called from multiple threads reading
-        different channels from the same file. Each thread opens its own
-        file handle to avoid synchronization overhead.
-        """
-        # Check for stop request before I/O
-        if self.stop_requested:
-            raise RuntimeError("Export stopped by user")
-
+        height, width = output_data.shape[:2]
+        resize = self.export_spec.resize_spec.policy != ResizePolicy.NONE
+        filled = []
         try:
-            # Check if resize is needed
-            resize_needed = (
-                self.export_spec.resize_spec.policy != ResizePolicy.NONE
-            )
-            
-            if resize_needed:
-                # Use OIIO-based resize
-                return self._read_and_resize_channel(filepath, channel_name, subimage_index)
-            else:
-                # Standard read without resize
-                inp = oiio.ImageInput.open(filepath)
-                if not inp:
-                    return None
-
-                # Seek to subimage if needed
-                if subimage_index > 0:
-                    if not inp.seek_subimage(subimage_index, 0):
-                        inp.close()
-                        return None
+            for subimage_index, channel_specs in sorted(channels_by_subimage.items()):
+                if not inp.seek_subimage(subimage_index, 0):
+                    continue
 
                 spec = inp.spec()
+                channel_index = {name: i for i, name in enumerate(spec.channelnames)}
+                wanted = [
+                    (out_idx, channel_index[out_ch.source.channel_name])
+                    for out_idx, out_ch in channel_specs
+                    if out_ch.source.channel_name in channel_index
+                ]
+                if not wanted:
+                    continue
+
+                chbegin = min(ch_idx for _, ch_idx in wanted)
+                chend = max(ch_idx for _, ch_idx in wanted) + 1
+                try:
+                    pixels = inp.read_image(subimage_index, 0, chbegin, chend, oiio.FLOAT)
+                    if pixels is None:
+                        continue
 
-                # Find channel index
-                ch_idx = None
-                for i, name in enumerate(spec.channelnames):
-                    if name == channel_name:
-                        ch_idx = i
-                        break
-
-                if ch_idx is None:
-                    inp.close()
-                    return None
-
-                # Read all pixels (simple approach)
-                pixels = inp.read_image()
-                inp.close()
+                    if resize and pixels.shape[:2] != (height, width):
+                        pixels = self._resize_pixels(pixels, width, height)
 
-                if pixels is None:
-                    return None
+                    for out_idx, ch_idx in wanted:
+                        np.copyto(output_data[:, :, out_idx], pixels[:, :, ch_idx - chbegin])
+                        filled.append(out_idx)
+                except Exception as e:
+                    # Keep channels from other subimages of this file
+                    self._log(f"Warning: Could not read subimage {subimage_index} of {filepath}: {e}")
+        finally:
+            inp.close()
 
-                # Extract channel and reshape
-                # pixels is typically (height, width, channels)
-                if isinstance(pixels, np.ndarray):
-                    channel_data = pixels[:, :, ch_idx].astype(np.float32)
-                    return channel_data
+        return filled
 
-                return None
+    def _resize_pixels(self, pixels: np.ndarray, width: int, height: int) -> np.ndarray:
+        """Resize (height, width, channels) float pixels with the configured filter."""
+        src_height, src_width, nchannels = pixels.shape
+        src_buf = oiio.ImageBuf(oiio.ImageSpec(src_width, src_height, nchannels, oiio.FLOAT))
+        src_buf.set_pixels(oiio.ROI(), np.ascontiguousarray(pixels))
 
-        except Exception as e:
-            # Only log if not due to stop request
-            if not self.stop_requested:
-                self._log(f"Error reading channel: {e}")
-            return None
-
-    def _read_and_resize_channel(
-        self, filepath: str, channel_name: str, subimage_index: int = 0
-    ) -> Optional[np.ndarray]:
-        """
-        Read a channel from file and resize to target dimensions.
-        """
-        try:
-            # Calculate target size
-            target_w, target_h = calculate_target_size(
-                list(self.sequences.values()),
-                self.export_spec.resize_spec.policy,
-                self.export_spec.resize_spec.custom_width,
-                self.export_spec.resize_spec.custom_height,
-            )
-            
-            if target_w <= 0 or target_h <= 0:
-                return None
-            
-            # Get filter name
-            filter_name = get_filter_name(self.export_spec.resize_spec.algorithm)
-            
-            # Read original image
-            inp = oiio.ImageInput.open(filepath)
-            if not inp:
-                return None
-            
-            if subimage_index > 0:
-                if not inp.seek_subimage(subimage_index, 0):
-                    inp.close()
-                    return None
-            
-            spec = inp.spec()
-            
-            # Find channel index
-            ch_idx = None
-            for i, name in enumerate(spec.channelnames):
-                if name == channel_name:
-                    ch_idx = i
-                    break
-            
-            if ch_idx is None:
-                inp.close()
-                return None
-            
-            # Read pixels
-            pixels = inp.read_image()
-            inp.close()
-            
-            if pixels is None:
-                return None
-            
-            if isinstance(pixels, np.ndarray):
-                channel_data = pixels[:, :, ch_idx].astype(np.float32)
-                
-                # Create ImageBuf from channel data
-                src_spec = oiio.ImageSpec(
-                    spec.width, spec.height, 1, oiio.FLOAT
-                )
-                src_buf = oiio.ImageBuf(src_spec)
-                
-                # Prepare data as contiguous C-order
-                channel_data_c = np.ascontiguousarray(channel_data)
-                src_buf.set_pixels(oiio.ROI(), channel_data_c.reshape(-1, 1))
-                
-                # Resize using ROI to specify target dimensions
-                # ImageBufAlgo.resize(src, roi=...) returns a new resized ImageBuf
-                roi = oiio.ROI(0, target_w, 0, target_h, 0, 1, 0, 1)
-                resized_buf = oiio.ImageBufAlgo.resize(src_buf, roi=roi, filtername=filter_name)
-                
-                if not isinstance(resized_buf, oiio.ImageBuf):
-                    return None
-                
-                # Read back resized data
-                resized_pixels = resized_buf.get_pixels(oiio.FLOAT, oiio.ROI())
-                if resized_pixels is not None:
-                    resized_array = np.asarray(resized_pixels, dtype=np.float32)
-                    # Ensure 2D shape (height, width) - squeeze out single channel dimension
-                    if resized_array.ndim == 3:
-                        return resized_array[:, :, 0]
-                    return resized_array
-                
-                return None
-        
-        except Exception as e:
-            if not self.stop_requested:
-                self._log(f"Error resizing channel: {e}")
-            return None
+        # ImageBufAlgo.resize(src, roi=...) returns a new resized ImageBuf
+        roi = oiio.ROI(0, width, 0, height, 0, 1, 0, nchannels)
+        filter_name = get_filter_name(self.export_spec.resize_spec.algorithm)
+        resized_buf = oiio.ImageBufAlgo.resize(src_buf, roi=roi, filtername=filter_name)
+        if not isinstance(resized_buf, oiio.ImageBuf):
+            raise RuntimeError(f"Resize to {width}x{height} failed")
 
+        return resized_buf.get_pixels(oiio.FLOAT, oiio.ROI())
 
     def _write_exr(self, output_path: Path, pixel_data: np.ndarray, spec_dict: dict) -> None:
         """Write output EXR file (thread-safe).
@@ -1137,7 +1198,15 @@ class ExportRunner(QRunnable):
                 self._log(f"[WRITE_EXR] pixel_data shape: {pixel_data.shape}, dtype: {pixel_data.dtype}, "
                          f"contiguous: {pixel_data.flags['C_CONTIGUOUS']}, min: {pixel_data.min()}, max: {pixel_data.max()}")
                 
-                if not out.write_image(pixel_data):
+                height = spec_dict["height"]
+                if height * spec_dict["width"] > _SCANLINE_WRITE_PIXELS:
+                    # Large frame: hand OIIO batches of scanlines to compress
+                    for ybegin in range(0, height, _SCANLINE_BATCH):
+                        yend = min(ybegin + _SCANLINE_BATCH, height)
+                        if not out.write_scanlines(ybegin, yend, 0, pixel_data[ybegin:yend]):
+                            error_msg = out.geterror() if hasattr(out, 'geterror') else "unknown error"
+                            raise RuntimeError(f"write_scanlines failed: OIIO error: {error_msg}")
+                elif not out.write_image(pixel_data):
                     error_msg = out.geterror() if hasattr(out, 'geterror') else "unknown error"
                     raise RuntimeError(f"write_image failed: OIIO error: {error_msg}")
 
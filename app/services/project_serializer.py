@@ -6,9 +6,16 @@ Designed to be easily extensible for future features.
 """
 
 import json
+import math
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# Optional fast JSON codec; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..core import (
     SequenceSpec,
     SequencePathPattern,
@@ -24,6 +31,20 @@ from ..core import (
 from .project_state import ProjectState
 
 
+def _has_non_finite(value: Any) -> bool:
+    """True if value holds a NaN or infinite float anywhere."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    tolist = getattr(value, "tolist", None)  # numpy arrays and scalars
+    if tolist is not None:
+        return _has_non_finite(tolist())
+    return False
+
+
 class ProjectSerializer:
     """
     Serializes and deserializes ProjectState to/from JSON.
@@ -99,6 +120,21 @@ class ProjectSerializer:
         """Save project to JSON file."""
         data = ProjectSerializer.serialize(state)
         file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # orjson writes NaN/Infinity as null, which would load back as None;
+        # json keeps them (as NaN/Infinity), so use it for such projects
+        if orjson is not None and not _has_non_finite(data):
+            try:
+                encoded = orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                )
+            except TypeError:
+                encoded = None  # e.g. a non-string key; let json handle it
+            if encoded is not None:
+                with open(file_path, "wb") as f:
+                    f.write(encoded)
+                return
+        
         with open(file_path, "w") as f:
             json.dump(data, f, indent=2)
 
@@ -108,8 +144,17 @@ class ProjectSerializer:
         if not file_path.exists():
             raise FileNotFoundError(f"Project file not found: {file_path}")
         
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # e.g. NaN/Infinity written by json; let json handle it
+                data = json.loads(raw)
+        else:
+            with open(file_path, "r") as f:
+                data = json.load(f)
         
         return ProjectSerializer.deserialize(data)
 
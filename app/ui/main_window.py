@@ -428,6 +428,8 @@ class MainWindow(QMainWindow):
             # Auto-discover sequences in the directory
             self._append_log("[LOAD] Discovering sequences in directory...")
             QApplication.processEvents()
+            # Rescan: drop validation results cached against earlier probes
+            ValidationEngine.clear_cache()
             discovered = SequenceDiscovery.discover_sequences(path)
             if not discovered:
                 loading_dialog.close()
@@ -908,7 +910,9 @@ class MainWindow(QMainWindow):
 
         # Validate
         export_spec = self.state.get_export_spec()
-        issues = ValidationEngine.validate_export(export_spec, self.state.sequences)
+        issues = ValidationEngine.validate_export(
+            export_spec, self.state.sequences, fail_fast=False
+        )
 
         errors = [i for i in issues if i.severity == ValidationSeverity.ERROR]
         warnings = [i for i in issues if i.severity == ValidationSeverity.WARNING]
@@ -1256,7 +1260,7 @@ class MainWindow(QMainWindow):
             from PySide6.QtWidgets import QApplication
             QApplication.processEvents()
             
-            probed_count = 0
+            to_probe = []
             for seq in self.state.list_sequences():
                 if not seq.source_dir.exists():
                     self._append_log(f"[WARNING] Source directory not found: {seq.source_dir}")
@@ -1267,14 +1271,21 @@ class MainWindow(QMainWindow):
                     try:
                         pattern = SequencePathPattern(seq.pattern.pattern)
                         first_frame_path = str(seq.source_dir / pattern.format(seq.frames[0]))
-                        probe = OiioAdapter.probe_file(first_frame_path)
-                        if probe:
-                            seq.static_probe = probe
-                            probed_count += 1
-                            QApplication.processEvents()
+                        to_probe.append((seq, first_frame_path))
                     except Exception as e:
                         self._append_log(f"[WARNING] Failed to probe {seq.display_name}: {e}")
             
+            # Probe all first frames concurrently
+            probes = OiioAdapter.probe_files([fp for _, fp in to_probe])
+            probed_count = 0
+            for (seq, first_frame_path), probe in zip(to_probe, probes):
+                if probe:
+                    seq.static_probe = probe
+                    probed_count += 1
+                else:
+                    self._append_log(f"[WARNING] Failed to probe {seq.display_name}: {first_frame_path}")
+            QApplication.processEvents()
+            
             if probed_count > 0:
                 self._append_log(f"[OK] Restored metadata for {probed_count} sequence(s)")
             
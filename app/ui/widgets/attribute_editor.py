@@ -4,6 +4,8 @@ Attribute editor widget for EXR metadata.
 Displays and edits attributes in a table with type-aware editors.
 """
 
+from dataclasses import replace
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -249,5 +251,4 @@ class EditAttributeDialog(QDialog):
 
     def get_attribute(self) -> AttributeSpec:
         """Get the updated attribute."""
-        self.attr.value = self.value_edit.text()
-        return self.attr
+        return replace(self.attr, value=self.value_edit.text())
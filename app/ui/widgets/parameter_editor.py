@@ -179,7 +179,7 @@ class ParameterEditor(QWidget):
             combo = QComboBox()
             
             if param.options:
-                combo.addItems(param.options)
+                combo.addItems(list(param.options))
             
             if param.value is not None:
                 idx = combo.findText(str(param.value))
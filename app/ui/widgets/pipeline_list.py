@@ -165,7 +165,7 @@ class PipelineList(QWidget):
         current_row = self.list.currentRow()
         if 0 <= current_row < len(self.pipeline.filters):
             filter = self.pipeline.filters[current_row]
-            filter.enabled = not filter.enabled
+            self.pipeline.set_filter_enabled(current_row, not filter.enabled)
             self._refresh_list()
             self.list.setCurrentRow(current_row)
             self.filter_toggled.emit(current_row)
@@ -0,0 +1,37 @@
+"""Round-trip tests for project files."""
+
+import math
+
+import pytest
+
+from app.processing import create_filter
+from app.services import project_serializer
+from app.services.project_serializer import ProjectSerializer
+from app.services.project_state import ProjectState
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_non_finite_parameters_round_trip(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        if project_serializer.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(project_serializer, "orjson", None)
+
+    state = ProjectState()
+    bc = create_filter("brightness_contrast")
+    bc.parameters["brightness"].value = float("nan")
+    bc.parameters["contrast"].value = float("-inf")
+    gamma = create_filter("gamma_correction")
+    gamma.parameters["gamma"].value = float("inf")
+    state.processing_pipeline.add_filter(bc)
+    state.processing_pipeline.add_filter(gamma)
+
+    path = tmp_path / "project.json"
+    ProjectSerializer.save_to_file(state, path)
+    loaded = ProjectSerializer.load_from_file(path)
+
+    bc_loaded, gamma_loaded = loaded.processing_pipeline.filters
+    assert math.isnan(bc_loaded.parameters["brightness"].value)
+    assert bc_loaded.parameters["contrast"].value == float("-inf")
+    assert gamma_loaded.parameters["gamma"].value == float("inf")